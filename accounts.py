@@ -0,0 +1,172 @@
+import hashlib
+import hmac
+import json
+import os
+import re
+import sqlite3
+from datetime import date
+from typing import Dict, Any, List, Optional
+
+# -----------------------------
+# Configuration
+# -----------------------------
+DB_PATH = "accounts.db"
+HASH_ITERATIONS = 100_000
+
+USER_COLUMNS = ("email", "first", "last", "password_hash", "role", "core", "industry", "first_login")
+BUDGET_COLUMNS = ("role", "pocket", "salary", "spending", "purpose", "target", "saved")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    email_key     TEXT PRIMARY KEY,
+    email         TEXT NOT NULL,
+    first         TEXT NOT NULL,
+    last          TEXT NOT NULL,
+    password_hash TEXT NOT NULL,
+    role          TEXT NOT NULL,
+    core          TEXT,
+    industry      TEXT,
+    first_login   INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS budgets (
+    id        INTEGER PRIMARY KEY,
+    email_key TEXT NOT NULL UNIQUE,
+    role      TEXT NOT NULL,
+    pocket    REAL NOT NULL DEFAULT 0,
+    salary    REAL NOT NULL DEFAULT 0,
+    spending  REAL NOT NULL DEFAULT 0,
+    purpose   TEXT NOT NULL DEFAULT '',
+    target    REAL NOT NULL DEFAULT 0,
+    saved     REAL NOT NULL DEFAULT 0,
+    goals     TEXT NOT NULL DEFAULT '[]'
+);
+
+-- Savings accrued since a budget's `saved` was last set, kept apart from the
+-- wide budgets rows so the daily accrual rewrites as few bytes as possible
+CREATE TABLE IF NOT EXISTS accruals (
+    budget_id INTEGER PRIMARY KEY,      -- budgets.id
+    monthly   INTEGER NOT NULL,         -- 1: income is a monthly salary, 0: daily pocket money
+    income    REAL NOT NULL,
+    spending  REAL NOT NULL,
+    amount    REAL NOT NULL DEFAULT 0,
+    through   INTEGER NOT NULL          -- date.toordinal() accrued up to
+);
+"""
+
+INSERT_USER_SQL = """
+INSERT OR IGNORE INTO users (email_key, email, first, last, password_hash, role, core, industry, first_login)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1)
+"""
+
+# Accrual inputs for a budgets row: mirrors budget.daily_income()
+ACCRUAL_INPUTS = "role != 'Student', CASE WHEN role = 'Student' THEN pocket ELSE salary END, spending"
+
+# -----------------------------
+# Validation (shared by signup and bulk import)
+# -----------------------------
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+def email_valid(email: str) -> bool:
+    return bool(EMAIL_RE.match(email.strip()))
+
+def passwords_ok(pw: str, confirm: str) -> str:
+    if len(pw) < 8:
+        return "Password must be at least 8 characters."
+    if pw != confirm:
+        return "Passwords do not match."
+    return ""
+
+# -----------------------------
+# Password hashing
+# -----------------------------
+def hash_password(pw: str) -> str:
+    salt = os.urandom(16)
+    dk = hashlib.pbkdf2_hmac("sha256", pw.encode("utf-8"), salt, HASH_ITERATIONS)
+    return f"pbkdf2_sha256${HASH_ITERATIONS}${salt.hex()}${dk.hex()}"
+
+def is_password_hash(value: str) -> bool:
+    parts = value.split("$")
+    return len(parts) == 4 and parts[0] == "pbkdf2_sha256" and parts[1].isdigit()
+
+def verify_password(pw: str, stored: str) -> bool:
+    if not is_password_hash(stored):
+        return False
+    _, iterations, salt, expected = stored.split("$")
+    dk = hashlib.pbkdf2_hmac("sha256", pw.encode("utf-8"), bytes.fromhex(salt), int(iterations))
+    return hmac.compare_digest(dk.hex(), expected)
+
+# -----------------------------
+# Account store (SQLite)
+# -----------------------------
+def connect(path: str = DB_PATH, check_same_thread: bool = True) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, check_same_thread=check_same_thread)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+def get_user(conn: sqlite3.Connection, email: str) -> Optional[Dict[str, Any]]:
+    row = conn.execute(
+        f"SELECT {', '.join(USER_COLUMNS)} FROM users WHERE email_key = ?", (email.strip().lower(),)
+    ).fetchone()
+    if row is None:
+        return None
+    profile = {k: row[k] for k in USER_COLUMNS if row[k] is not None}
+    profile["first_login"] = bool(row["first_login"])
+    return profile
+
+def create_user(conn: sqlite3.Connection, profile: Dict[str, Any]) -> bool:
+    """Add one account (profile carries password_hash); False if the email is taken."""
+    key = profile["email"].strip().lower()
+    with conn:
+        cur = conn.execute(INSERT_USER_SQL, (key, profile["email"].strip(), profile["first"], profile["last"],
+                                             profile["password_hash"], profile["role"],
+                                             profile.get("core"), profile.get("industry")))
+    return cur.rowcount == 1
+
+def save_budget(conn: sqlite3.Connection, email: str, data: Dict[str, Any]) -> None:
+    # An upsert keeps the budget's id, which is what its accrual is keyed on
+    key = email.strip().lower()
+    with conn:
+        conn.execute(
+            f"INSERT INTO budgets (email_key, {', '.join(BUDGET_COLUMNS)}, goals)"
+            f" VALUES (?, {', '.join('?' * len(BUDGET_COLUMNS))}, ?)"
+            f" ON CONFLICT (email_key) DO UPDATE SET {', '.join(f'{k} = excluded.{k}' for k in BUDGET_COLUMNS)},"
+            f" goals = excluded.goals",
+            (key, *(data.get(k, "" if k in ("role", "purpose") else 0.0) for k in BUDGET_COLUMNS),
+             json.dumps(data.get("goals", []))),
+        )
+        # The saved amount was just set, so accrual starts over from today
+        conn.execute(
+            f"INSERT OR REPLACE INTO accruals (budget_id, monthly, income, spending, through)"
+            f" SELECT id, {ACCRUAL_INPUTS}, ? FROM budgets WHERE email_key = ?",
+            (date.today().toordinal(), key),
+        )
+
+def save_goals(conn: sqlite3.Connection, email: str, goals: List[Dict[str, Any]]) -> None:
+    # Only the goals column, so a concurrent update to saved is not overwritten
+    with conn:
+        conn.execute("UPDATE budgets SET goals = ? WHERE email_key = ?", (json.dumps(goals), email.strip().lower()))
+
+# Saved as entered plus everything accrued since
+SAVED_SQL = "b.saved + COALESCE(a.amount, 0)"
+ACCRUALS_JOIN = "budgets b LEFT JOIN accruals a ON a.budget_id = b.id"
+
+def get_saved(conn: sqlite3.Connection, email: str) -> Optional[float]:
+    row = conn.execute(
+        f"SELECT {SAVED_SQL} AS saved FROM {ACCRUALS_JOIN} WHERE b.email_key = ?", (email.strip().lower(),)
+    ).fetchone()
+    return None if row is None else row["saved"]
+
+def get_budget(conn: sqlite3.Connection, email: str) -> Optional[Dict[str, Any]]:
+    columns = ", ".join(SAVED_SQL + " AS saved" if k == "saved" else f"b.{k}" for k in BUDGET_COLUMNS)
+    row = conn.execute(
+        f"SELECT {columns}, b.goals FROM {ACCRUALS_JOIN} WHERE b.email_key = ?", (email.strip().lower(),)
+    ).fetchone()
+    if row is None:
+        return None
+    data = {k: row[k] for k in BUDGET_COLUMNS}
+    data["goals"] = json.loads(row["goals"])
+    return data
@@ -0,0 +1,88 @@
+"""Daily savings accrual for every budget in the store.
+
+    python accrual.py                # accrue up to today once
+    python accrual.py --loop         # keep running, checking every --interval seconds
+
+Accrued savings live in the narrow accruals table (see accounts.py), next to
+the day each budget was last accrued up to. One UPDATE statement adds each
+budget's daily savings for every day since then, over all rows at once, and
+only the small accrual rows are rewritten. A budget's saved amount is its
+entered `saved` plus the accrued amount. Running the job twice on the same
+day is a no-op, and a job that missed days catches up on the next run.
+Negative daily savings do not reduce the saved amount.
+"""
+import argparse
+import sqlite3
+import sys
+import threading
+import time
+from datetime import date
+from typing import Optional
+
+from accounts import DB_PATH, connect
+from finance_config import get_config
+
+CHECK_INTERVAL = 15 * 60  # seconds between runs in loop mode
+
+ACCRUE_SQL = """
+UPDATE accruals
+SET amount = amount + (:today - through)
+                    * MAX(CASE WHEN monthly THEN income / :days_per_month ELSE income END - spending, 0),
+    through = :today
+WHERE through < :today
+"""
+
+# -----------------------------
+# Accrual
+# -----------------------------
+def accrue(conn: sqlite3.Connection, today: Optional[date] = None) -> int:
+    """Accrue all budgets up to `today`; returns the number of budgets updated."""
+    params = {"today": (today or date.today()).toordinal(), "days_per_month": get_config().days_per_month}
+    # Checkpoint once after the commit instead of part-way through the update
+    conn.execute("PRAGMA wal_autocheckpoint=0")
+    try:
+        with conn:
+            updated = conn.execute(ACCRUE_SQL, params).rowcount
+    finally:
+        conn.execute("PRAGMA wal_autocheckpoint=1000")
+    conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+    return updated
+
+def run_forever(db_path: str = DB_PATH, interval: float = CHECK_INTERVAL, stop: Optional[threading.Event] = None) -> None:
+    stop = stop or threading.Event()
+    conn = connect(db_path)
+    try:
+        while not stop.is_set():
+            try:
+                accrue(conn)
+            except sqlite3.OperationalError as e:
+                # Typically "database is locked"; the next run catches up
+                print(f"accrual: {e}", file=sys.stderr)
+            stop.wait(interval)
+    finally:
+        conn.close()
+
+def start_scheduler(db_path: str = DB_PATH, interval: float = CHECK_INTERVAL) -> threading.Event:
+    """Run accrual in a daemon thread; set the returned event to stop it."""
+    stop = threading.Event()
+    threading.Thread(target=run_forever, args=(db_path, interval, stop), name="accrual", daemon=True).start()
+    return stop
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default=DB_PATH, help="account store path")
+    parser.add_argument("--loop", action="store_true", help="keep running on a schedule")
+    parser.add_argument("--interval", type=float, default=CHECK_INTERVAL, help="seconds between runs with --loop")
+    args = parser.parse_args(argv)
+
+    if args.loop:
+        run_forever(args.db, args.interval)
+        return
+    conn = connect(args.db)
+    start = time.perf_counter()
+    updated = accrue(conn)
+    conn.close()
+    print(f"Accrued {updated:,} budgets in {time.perf_counter() - start:.3f}s")
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,28 @@
-import base64
 import re
+import threading
+from datetime import date
+from types import MappingProxyType
 from typing import Dict, Any, List, Tuple
 import streamlit as st
 import random
+import altair as alt
+import numpy as np
+import pandas as pd
+
+import accounts
+import accrual
+import assets
+import budget
+import chat_snapshot
+from accounts import email_valid, passwords_ok
+from finance_config import get_config, growth_factor, monthly_tax
+from goals import GoalPlanner
+from metrics import MetricsGraph
 
 # -----------------------------
 # Configuration
 # -----------------------------
 APP_TITLE = "Finance Chatbot"
-BG_IMAGE_PATH = "silvia_bg.jpg"  # Optional local image
-BG_IMAGE_URL = ""  # Optional URL background
 
 DEFAULT_EMAIL = "2k24cse112@kiot.ac.in"
 DEFAULT_PASSWORD = "12345678"
@@ -17,36 +30,20 @@ DEFAULT_PASSWORD = "12345678"
 # -----------------------------
 # Finance Bot Helper Functions
 # -----------------------------
+NUMBER_RE = re.compile(r"(\d+(\.\d+)?)")
+
 def extract_number(text):
-    m = re.search(r"(\d+(\.\d+)?)", str(text).replace(",", ""))
+    m = NUMBER_RE.search(str(text).replace(",", ""))
     return float(m.group(1)) if m else None
 
 def format_inr(x):
     return f"₹{int(x):,}" if abs(x - int(x)) < 0.01 else f"₹{x:,.2f}"
 
-def monthly_tax(income):
-    annual = income * 12
-    tax = 0
-    if annual <= 250000:
-        tax = 0
-    elif annual <= 500000:
-        tax = (annual - 250000) * 0.05
-    elif annual <= 1000000:
-        tax = 250000*0.05 + (annual - 500000)*0.2
-    else:
-        tax = 250000*0.05 + 500000*0.2 + (annual - 1000000)*0.3
-    return round(tax/12,2)
-
-def compound_amount(P, rate, years):
-    A = P * ((1 + rate) ** years)
-    return round(A,2)
-
 def simple_finance_bot(user_msg, chat_history=None, state=None):
     if chat_history is None:
         chat_history = []
     if state is None:
-        state = {"step":0, "mode":None, "idea":None, "budget":None, "deposit":None, 
-                 "years":None, "senior":None, "salary":None, "spending":None}
+        state = chat_snapshot.new_state()
 
     text = user_msg.strip().lower()
     
@@ -123,8 +120,8 @@ def simple_finance_bot(user_msg, chat_history=None, state=None):
             return chat_history, state
         if state["step"] == 12:
             state["senior"] = True if "yes" in text else False
-            rate = 0.08 if state["senior"] else 0.06
-            A = compound_amount(state["deposit"], rate, state["years"])
+            rate = get_config().deposit_rate(state["senior"])
+            A = round(state["deposit"] * growth_factor(state["senior"], state["years"]), 2)
             monthly = round(A/(state["years"]*12),2)
             add_bot_message(f"Deposit: {format_inr(state['deposit'])}\nYears: {state['years']}\nRate: {rate*100:.1f}%\nTotal after {state['years']} years: {format_inr(A)}\nMonthly average: {format_inr(monthly)}")
             state["step"] = 99
@@ -158,7 +155,7 @@ def simple_finance_bot(user_msg, chat_history=None, state=None):
     if state["step"] == 99:
         add_bot_message("Done ✅. Type 'reset' to start over or choose another mode.")
         if "reset" in text:
-            state = {"step":0,"mode":None,"idea":None,"budget":None,"deposit":None,"years":None,"senior":None,"salary":None,"spending":None}
+            state = chat_snapshot.new_state()
             add_bot_message("Chat reset! What would you like to do?\nOptions: Business, Interest, Profit-Loss")
             state["step"] = 1
         return chat_history, state
@@ -169,9 +166,11 @@ def simple_finance_bot(user_msg, chat_history=None, state=None):
 # -----------------------------
 # Session State Initialization
 # -----------------------------
-if "users" not in st.session_state:
-    st.session_state.users: Dict[str, Dict[str, Any]] = { # type: ignore
-        DEFAULT_EMAIL.lower(): {
+@st.cache_resource
+def default_users():
+    # Shared read-only by every session; a session copies a profile only when it logs in
+    return MappingProxyType({
+        DEFAULT_EMAIL.lower(): MappingProxyType({
             "first": "Default",
             "last": "User",
             "email": DEFAULT_EMAIL,
@@ -179,154 +178,109 @@ if "users" not in st.session_state:
             "role": "Student",
             "core": "Default Core",
             "first_login": True,
-        }
-    }
+        })
+    })
+
+if "users" not in st.session_state:
+    st.session_state.users: Dict[str, Dict[str, Any]] = {} # type: ignore
 
 if "page" not in st.session_state:
     st.session_state.page = "login"
 
 if "budget_data" not in st.session_state:
-    st.session_state.budget_data: Dict[str, Any] = {} # type: ignore
+    st.session_state.budget_data = budget.EMPTY_BUDGET
 
 if "current_user" not in st.session_state:
     st.session_state.current_user = None
 
-# Initialize chatbot state
-if "chatbot_history" not in st.session_state:
-    st.session_state.chatbot_history = []
-
-if "chatbot_state" not in st.session_state:
-    st.session_state.chatbot_state = {"step":0, "mode":None, "idea":None, "budget":None, 
-                                      "deposit":None, "years":None, "senior":None, 
-                                      "salary":None, "spending":None}
-
 # -----------------------------
 # Helpers
 # -----------------------------
-def _encode_bg(path: str) -> str:
-    try:
-        with open(path, "rb") as f:
-            return base64.b64encode(f.read()).decode("utf-8")
-    except Exception:
-        return ""
-
 def set_background():
-    b64 = _encode_bg(BG_IMAGE_PATH) if BG_IMAGE_PATH else ""
-    if b64:
-        bg_css = f"background-image: url('data:image/jpg;base64,{b64}');"
-    elif BG_IMAGE_URL:
-        bg_css = f"background-image: url('{BG_IMAGE_URL}');"
-    else:
-        bg_css = "background-image: radial-gradient(ellipse at top, #524a7b 0%, #1a1a2e 60%, #0f0f1a 100%);"
+    st.markdown(assets.background_css(), unsafe_allow_html=True)
 
-    st.markdown(f"""
-        <style>
-            .stApp {{
-                {bg_css}
-                background-size: cover;
-                background-position: center center;
-                background-attachment: fixed;
-            }}
-            .overlay {{
-                position: fixed;
-                inset: 0;
-                background: rgba(10, 12, 22, 0.35);
-                backdrop-filter: blur(1.2px);
-                z-index: 0;
-            }}
-            .glass {{
-                background: rgba(255, 255, 255, 0.08);
-                border: 1px solid rgba(255, 255, 255, 0.18);
-                box-shadow: 0 10px 30px rgba(0,0,0,0.25);
-                backdrop-filter: blur(8px);
-                -webkit-backdrop-filter: blur(8px);
-                border-radius: 16px;
-                padding: 28px;
-            }}
-            .hero h1 {{
-                color: #ffffff;
-                font-weight: 700;
-                letter-spacing: 0.2px;
-                margin-bottom: 6px;
-            }}
-            .chat-message {{
-                padding: 10px;
-                margin: 5px 0;
-                border-radius: 10px;
-                max-width: 80%;
-            }}
-            .user-message {{
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                margin-left: auto;
-                text-align: right;
-            }}
-            .bot-message {{
-                background: rgba(255, 255, 255, 0.15);
-                color: white;
-                margin-right: auto;
-                text-align: left;
-            }}
-            .chat-container {{
-                height: 400px;
-                overflow-y: auto;
-                padding: 20px;
-                background: rgba(255, 255, 255, 0.05);
-                border-radius: 10px;
-                margin: 20px 0;
-            }}
-            footer {{visibility: hidden;}}
-            a {{ text-decoration: none; }}
-            /* Custom styling for account buttons */
-            .account-button {{
-                width: 2.5cm !important;
-                max-width: 2.5cm !important;
-                min-width: 2.5cm !important;
-                height: 32px !important;
-                padding: 4px 8px !important;
-                font-size: 12px !important;
-                margin: 2px 0 !important;
-                text-align: center !important;
-            }}
-            .stButton[data-testid="baseButton-secondary"] > button {{
-                width: 2.5cm !important;
-                max-width: 2.5cm !important;
-                min-width: 2.5cm !important;
-                height: 32px !important;
-                padding: 4px 8px !important;
-                font-size: 12px !important;
-                margin: 2px 0 !important;
-            }}
-        </style>
-        <div class="overlay"></div>
-    """, unsafe_allow_html=True)
+@st.cache_resource
+def get_account_store():
+    return accounts.connect(check_same_thread=False)
+
+@st.cache_resource
+def store_write_lock() -> threading.Lock:
+    return threading.Lock()
 
-def email_valid(email: str) -> bool:
-    return bool(re.match(r"^[^@\s]+@[^@\s]+\.[^@\s]+$", email.strip()))
+def store_write(write, *args) -> Any:
+    # Every session shares one connection, and a sqlite3 transaction belongs to the
+    # connection, so writes are serialized: one session's commit must not cover another's
+    with store_write_lock():
+        return write(get_account_store(), *args)
 
-def passwords_ok(pw: str, confirm: str) -> str:
-    if len(pw) < 8:
-        return "Password must be at least 8 characters."
-    if pw != confirm:
-        return "Passwords do not match."
-    return ""
+def save_budget() -> None:
+    # Budgets are kept only for accounts in the store; the built-in default account lives in memory
+    email = st.session_state.current_user
+    if accounts.get_user(get_account_store(), email) is not None:
+        store_write(accounts.save_budget, email, st.session_state.budget_data)
+
+@st.cache_resource
+def start_accrual():
+    # One background accrual job per process, not per session
+    return accrual.start_scheduler()
 
 def user_exists(email: str) -> bool:
-    return email.lower() in st.session_state.users
+    if email.lower() in st.session_state.users or email.lower() in default_users():
+        return True
+    return accounts.get_user(get_account_store(), email) is not None
 
-def create_user(profile: Dict[str, Any]) -> None:
+def create_user(profile: Dict[str, Any]) -> bool:
+    # Signups go to the store so anything saved for them belongs to a real account
+    profile["password_hash"] = accounts.hash_password(profile.pop("password"))
+    if not store_write(accounts.create_user, profile):
+        return False
     profile["first_login"] = True
     st.session_state.users[profile["email"].lower()] = profile
+    return True
 
 def auth_user(email: str, password: str) -> bool:
     u = st.session_state.users.get(email.lower())
-    if not u:
+    if not u and email.lower() in default_users():
+        u = default_users()[email.lower()]
+        if u.get("password") == password:
+            st.session_state.users[email.lower()] = dict(u)
+            st.session_state.current_user = email.lower()
+            return True
         return False
-    if u.get("password") == password:
+    if u:
+        # Store-backed profiles keep their hash, so a later login in this session still checks it
+        if "password_hash" in u:
+            ok = accounts.verify_password(password, u["password_hash"])
+        else:
+            ok = u.get("password") == password
+        if ok:
+            st.session_state.current_user = email.lower()
+            return True
+        return False
+    # Fall back to accounts created through bulk import
+    u = accounts.get_user(get_account_store(), email)
+    if u and accounts.verify_password(password, u["password_hash"]):
+        st.session_state.users[email.lower()] = u
         st.session_state.current_user = email.lower()
         return True
     return False
 
+def get_chat_log():
+    # Replayed once per process so sessions survive restarts
+    return chat_snapshot.shared_log()
+
+def chat_turn(user_msg: str) -> None:
+    prev = len(st.session_state.chatbot_history)
+    st.session_state.chatbot_history, st.session_state.chatbot_state = simple_finance_bot(
+        user_msg,
+        st.session_state.chatbot_history,
+        st.session_state.chatbot_state
+    )
+    if st.session_state.current_user:
+        get_chat_log().append_delta(st.session_state.current_user,
+                                    st.session_state.chatbot_history[prev:],
+                                    st.session_state.chatbot_state)
+
 def nav_to(page: str):
     st.session_state.page = page
 
@@ -365,6 +319,10 @@ def account_dropdown():
         if st.button("Help", key="help_btn", type="secondary"):
             st.info("Contact support@financechat.com for assistance.")
         if st.button("Logout", key="logout_btn", type="secondary"):
+            # Drop everything tied to this user so the next login in this browser starts clean
+            for key in ("chatbot_history", "chatbot_state", "goal_planner"):
+                st.session_state.pop(key, None)
+            st.session_state.budget_data = budget.EMPTY_BUDGET
             st.session_state.current_user = None
             nav_to("login")
 
@@ -384,6 +342,11 @@ def login_card():
                 st.error("Invalid email or password.")
             else:
                 user = st.session_state.users[email.lower()]
+                stored = accounts.get_budget(get_account_store(), email)
+                if stored:
+                    st.session_state.budget_data = stored
+                    st.session_state.goal_planner = None
+                    user["first_login"] = False
                 if user.get("first_login", True):
                     nav_to("predefined_questions")
                 else:
@@ -452,9 +415,11 @@ def signup_card():
                         "role": role,
                         **extra,
                     }
-                    create_user(profile)
-                    st.success("Account created! You can log in now.")
-                    nav_to("login")
+                    if create_user(profile):
+                        st.success("Account created! You can log in now.")
+                        nav_to("login")
+                    else:
+                        st.error("An account with this email already exists.")
 
         if st.button("⬅ Back to Login"):
             nav_to("login")
@@ -502,6 +467,8 @@ def predefined_questions_page():
                     "target": target,
                     "saved": 0.0
                 }
+                st.session_state.goal_planner = None
+                save_budget()
                 user["first_login"] = False
                 st.success("Data saved! Redirecting to dashboard...")
                 nav_to("dashboard")
@@ -519,6 +486,8 @@ def predefined_questions_page():
                     "target": target,
                     "saved": 0.0
                 }
+                st.session_state.goal_planner = None
+                save_budget()
                 user["first_login"] = False
                 st.success("Data saved! Redirecting to dashboard...")
                 nav_to("dashboard")
@@ -554,6 +523,8 @@ def dashboard_page():
         nav_to("ecotally")
     if st.button("📊 Budget Summary"):
         nav_to("budget_summary")
+    if st.button("🎯 Goals Planner"):
+        nav_to("goals")
     st.markdown('</div>', unsafe_allow_html=True)
 
 def ecotally_page():
@@ -567,10 +538,11 @@ def ecotally_page():
         if role == "Student":
             pocket = st.number_input("Daily Pocket Money:", min_value=0.0, step=10.0)
             spending = st.number_input("Daily Spending:", min_value=0.0, step=10.0)
-            remaining = pocket - spending
+            m = get_metrics("ecotally_metrics", role=role, pocket=pocket, spending=spending)
+            remaining = m["daily_savings"]
             st.write(f"**Daily Remaining Balance:** {remaining:.2f}")
             
-            monthly_remaining = remaining * 30
+            monthly_remaining = m["monthly_savings"]
             st.write(f"**Monthly Projection:** {monthly_remaining:.2f}")
             
             if remaining > 0:
@@ -583,9 +555,8 @@ def ecotally_page():
         else:  # Professional
             salary = st.number_input("Monthly Salary:", min_value=0.0, step=100.0)
             spending = st.number_input("Daily Spending:", min_value=0.0, step=10.0)
-            
-            monthly_spending = spending * 30
-            remaining = salary - monthly_spending
+            m = get_metrics("ecotally_metrics", role=role, salary=salary, spending=spending)
+            remaining = m["monthly_savings"]
             st.write(f"**Monthly Remaining Balance:** {remaining:.2f}")
             
             if remaining > 0:
@@ -605,44 +576,213 @@ def budget_summary_page():
         st.subheader("📊 Budget Summary")
 
         data = st.session_state.budget_data
+        if data and st.session_state.current_user:
+            # The accrual job may have moved saved on since login
+            saved = accounts.get_saved(get_account_store(), st.session_state.current_user)
+            if saved is not None:
+                data["saved"] = saved
         if data:
             st.write(f"**Purpose:** {data.get('purpose','')}")
             st.write(f"**Target Amount:** ₹{data.get('target',0):,.2f}")
             st.write(f"**Amount Saved:** ₹{data.get('saved', 0):,.2f}")
 
-            daily_savings = 0
+            m = get_metrics()
+            daily_savings = m["daily_savings"]
             if data.get("role") == "Student":
-                daily_savings = data.get("pocket", 0) - data.get("spending", 0)
                 st.write(f"**Daily Pocket Money:** ₹{data.get('pocket', 0):.2f}")
                 st.write(f"**Daily Spending:** ₹{data.get('spending', 0):.2f}")
                 st.write(f"**Daily Savings:** ₹{daily_savings:.2f}")
             elif data.get("role") == "Professional":
                 monthly_salary = data.get("salary", 0)
                 daily_spending = data.get("spending", 0)
-                daily_income = monthly_salary / 30
-                daily_savings = daily_income - daily_spending
+                daily_income = m["daily_income"]
                 st.write(f"**Monthly Salary:** ₹{monthly_salary:,.2f}")
                 st.write(f"**Daily Income:** ₹{daily_income:.2f}")
                 st.write(f"**Daily Spending:** ₹{daily_spending:.2f}")
                 st.write(f"**Daily Savings:** ₹{daily_savings:.2f}")
 
+            planner = get_goal_planner()
+            plan = planner.plan(daily_savings) if len(planner) > 1 else None
+
             # Calculate days to achieve target
-            remaining_amount = data.get("target", 0) - data.get("saved", 0)
-            
             if daily_savings > 0:
-                days_needed = remaining_amount / daily_savings
+                days_needed = m["days_needed"]
+                if plan:
+                    # Other goals share the daily savings, so use this goal's allocation from the plan
+                    days_needed = next(r["days"] for r in plan if r["purpose"] == primary_goal(data)["purpose"])
                 if days_needed <= 0:
                     st.success(f"🎉 Congratulations! Goal of ₹{data['target']:,.2f} for {data['purpose']} achieved!")
+                elif days_needed == float("inf"):
+                    st.warning("⚠️ Your other goals take all of your daily savings, so nothing is left for this goal.")
                 else:
-                    st.info(f"⏳ You need approximately **{int(days_needed)} days** ({int(days_needed/30)} months and {int(days_needed%30)} days) to reach your goal.")
+                    month = get_config().days_per_month
+                    shared = " with your savings shared across your goals" if plan else ""
+                    st.info(f"⏳ You need approximately **{int(days_needed)} days** ({int(days_needed/month)} months and {int(days_needed%month)} days) to reach your goal{shared}.")
                     
                     # Show progress bar
-                    progress = min(data.get("saved", 0) / data.get("target", 1), 1.0)
+                    progress = m["progress"]
                     st.progress(progress)
                     st.write(f"**Progress:** {progress*100:.1f}% complete")
             else:
                 st.error("⚠️ Your spending is higher than or equal to your income. You cannot save with current spending habits.")
                 st.write("💡 **Suggestion:** Reduce daily spending to start saving towards your goal.")
+
+            if plan:
+                st.markdown("#### 🎯 Goals Plan")
+                goals_table(plan)
+
+            whatif_panel(data)
+        else:
+            st.info("No budget data available. Please complete the Predefined Questions first.")
+            if st.button("Go to Predefined Questions"):
+                nav_to("predefined_questions")
+
+        if st.button("⬅ Back to Dashboard"):
+            nav_to("dashboard")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+def primary_goal(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {"purpose": data.get("purpose") or "Savings goal", "target": data.get("target", 0),
+            "saved": data.get("saved", 0), "deadline": None, "priority": 1}
+
+def get_metrics(key: str = "metrics", **inputs) -> MetricsGraph:
+    # One memoized graph per session; with no inputs it tracks budget_data
+    graph = st.session_state.get(key)
+    if graph is None:
+        graph = st.session_state[key] = MetricsGraph()
+    # A reloaded config invalidates only the nodes that depend on it
+    graph.update(days_per_month=get_config().days_per_month)
+    if inputs:
+        graph.update(**inputs)
+    else:
+        graph.update_from(st.session_state.budget_data)
+    return graph
+
+def get_goal_planner() -> GoalPlanner:
+    # Kept in session state so adding or removing a goal re-plans incrementally
+    data = st.session_state.budget_data
+    planner = st.session_state.get("goal_planner")
+    primary = primary_goal(data)
+    if planner is None or planner.today != date.today():
+        planner = GoalPlanner([primary, *data.get("goals", [])])
+        st.session_state.goal_planner = planner
+    elif planner.get(primary["purpose"]) != primary:
+        # saved is refreshed from the store as savings accrue
+        planner.upsert(primary)
+    return planner
+
+def goals_table(rows: List[Dict[str, Any]]):
+    st.dataframe(pd.DataFrame([{
+        "Goal": r["purpose"],
+        "Priority": r["priority"],
+        "Deadline": r["deadline"] or "-",
+        "Target": f"₹{r['target']:,.2f}",
+        "Saved": f"₹{r['saved']:,.2f}",
+        "Daily Allocation": f"₹{r['allocated']:,.2f}",
+        "Days to Goal": "-" if r["days"] == float("inf") else int(r["days"]),
+        "On Track": "✅" if r["on_track"] else "⚠️",
+    } for r in rows]), hide_index=True, use_container_width=True)
+
+@st.cache_data(max_entries=1000)
+def whatif_grid(role: str, pocket: float, salary: float, spending: float, target: float, saved: float,
+                config_version: str):
+    income = MetricsGraph(role=role, pocket=pocket, salary=salary)["daily_income"]
+    return budget.days_to_goal_grid(income, spending, target, saved)
+
+def whatif_panel(data: Dict[str, Any]):
+    st.markdown("#### 🔮 What-if")
+    # The whole grid is cached per budget, so moving a slider is only a lookup
+    grid = whatif_grid(data.get("role", ""), data.get("pocket", 0), data.get("salary", 0),
+                       data.get("spending", 0), data.get("target", 0), data.get("saved", 0),
+                       get_config().version)
+    spend_cuts = budget.SPEND_CUTS.tolist()
+    income_cuts = budget.INCOME_CUTS.tolist()
+
+    scol, icol = st.columns(2)
+    with scol:
+        spend_cut = st.select_slider("Cut daily spending by", options=spend_cuts, value=0, format_func=lambda p: f"{p}%")
+    with icol:
+        income_cut = st.select_slider("If income drops by", options=income_cuts, value=0, format_func=lambda p: f"{p}%")
+
+    days = grid[income_cuts.index(income_cut), spend_cuts.index(spend_cut)]
+    if days == float("inf"):
+        st.warning("With these changes you would not save anything per day.")
+    else:
+        month = get_config().days_per_month
+        st.info(f"⏳ Days to goal: **{int(days)} days** ({int(days/month)} months and {int(days%month)} days)")
+
+    row = grid[income_cuts.index(income_cut)]
+    chart = pd.DataFrame({"Days to goal": np.where(np.isinf(row), np.nan, row)},
+                         index=pd.Index(spend_cuts, name="Spending cut (%)"))
+    st.line_chart(chart)
+
+    with st.expander("Days-to-goal heatmap"):
+        cells = pd.DataFrame(
+            [(i, s, None if np.isinf(d) else int(d)) for i, r in zip(income_cuts, grid) for s, d in zip(spend_cuts, r)],
+            columns=["Income drop (%)", "Spending cut (%)", "Days to goal"],
+        )
+        st.altair_chart(alt.Chart(cells).mark_rect().encode(
+            x="Spending cut (%):O", y="Income drop (%):O",
+            color=alt.Color("Days to goal:Q", scale=alt.Scale(scheme="viridis", reverse=True)),
+            tooltip=list(cells.columns),
+        ), use_container_width=True)
+
+def goals_page():
+    with st.container():
+        st.markdown('<div class="glass">', unsafe_allow_html=True)
+        st.subheader("🎯 Goals Planner")
+
+        data = st.session_state.budget_data
+        if data:
+            planner = get_goal_planner()
+            daily_savings = get_metrics()["daily_savings"]
+            st.write(f"**Daily Savings:** ₹{daily_savings:.2f}")
+
+            with st.form("goal_form", clear_on_submit=True):
+                purpose = st.text_input("Goal")
+                tcol, scol = st.columns(2)
+                with tcol:
+                    target = st.number_input("Target Amount:", min_value=0.0, step=50.0)
+                with scol:
+                    saved = st.number_input("Already Saved:", min_value=0.0, step=50.0)
+                dcol, pcol = st.columns(2)
+                with dcol:
+                    deadline = st.date_input("Deadline (optional)", value=None, min_value=date.today())
+                with pcol:
+                    priority = st.number_input("Priority (1 = highest)", min_value=1, max_value=10, value=2, step=1)
+                add = st.form_submit_button("Add Goal", use_container_width=True)
+
+            if add:
+                names = [g["purpose"].lower() for g in planner.goals()]
+                if not purpose.strip():
+                    st.error("Please enter a name for the goal.")
+                elif purpose.strip().lower() in names:
+                    st.error("A goal with this name already exists.")
+                elif target <= 0:
+                    st.error("Please enter a target amount.")
+                else:
+                    goal = {"purpose": purpose.strip(), "target": target, "saved": saved,
+                            "deadline": deadline.isoformat() if deadline else None, "priority": int(priority)}
+                    data.setdefault("goals", []).append(goal)
+                    planner.upsert(goal)
+                    store_write(accounts.save_goals, st.session_state.current_user, data["goals"])
+                    st.success("Goal added!")
+
+            if daily_savings <= 0:
+                st.error("⚠️ Your spending is higher than or equal to your income. You cannot save with current spending habits.")
+            goals_table(planner.plan(daily_savings))
+
+            extra = [g["purpose"] for g in data.get("goals", [])]
+            if extra:
+                rcol, bcol = st.columns([3, 1])
+                with rcol:
+                    to_remove = st.selectbox("Remove a goal", extra, label_visibility="collapsed")
+                with bcol:
+                    if st.button("Remove Goal", type="secondary"):
+                        data["goals"] = [g for g in data["goals"] if g["purpose"] != to_remove]
+                        planner.remove(to_remove)
+                        store_write(accounts.save_goals, st.session_state.current_user, data["goals"])
+                        st.rerun()
         else:
             st.info("No budget data available. Please complete the Predefined Questions first.")
             if st.button("Go to Predefined Questions"):
@@ -659,9 +799,16 @@ def finance_chatbot_page():
     user = st.session_state.users.get(st.session_state.current_user, {})
     st.write(f"**Welcome, {user.get('first','User')}!**")
     
-    # Initialize chatbot if first visit
+    # Chat state is only allocated for sessions that open the chatbot
+    if "chatbot_history" not in st.session_state:
+        st.session_state.chatbot_history = []
+        st.session_state.chatbot_state = chat_snapshot.new_state()
+
+    # Initialize chatbot if first visit, resuming a saved conversation if there is one
+    if not st.session_state.chatbot_history and st.session_state.current_user:
+        st.session_state.chatbot_history, st.session_state.chatbot_state = get_chat_log().restore(st.session_state.current_user)
     if not st.session_state.chatbot_history:
-        st.session_state.chatbot_history, st.session_state.chatbot_state = simple_finance_bot("", [], st.session_state.chatbot_state)
+        chat_turn("")
     
     # Display chat history
     st.markdown('<div class="chat-container">', unsafe_allow_html=True)
@@ -687,19 +834,15 @@ def finance_chatbot_page():
             back_button = st.form_submit_button("⬅ Back", use_container_width=True)
     
     if send_button and user_input:
-        st.session_state.chatbot_history, st.session_state.chatbot_state = simple_finance_bot(
-            user_input, 
-            st.session_state.chatbot_history, 
-            st.session_state.chatbot_state
-        )
+        chat_turn(user_input)
         st.rerun()
     
     if reset_button:
         st.session_state.chatbot_history = []
-        st.session_state.chatbot_state = {"step":0, "mode":None, "idea":None, "budget":None, 
-                                         "deposit":None, "years":None, "senior":None, 
-                                         "salary":None, "spending":None}
-        st.session_state.chatbot_history, st.session_state.chatbot_state = simple_finance_bot("", [], st.session_state.chatbot_state)
+        st.session_state.chatbot_state = chat_snapshot.new_state()
+        if st.session_state.current_user:
+            get_chat_log().reset(st.session_state.current_user)
+        chat_turn("")
         st.rerun()
     
     if back_button:
@@ -713,6 +856,7 @@ def finance_chatbot_page():
 # -----------------------------
 st.set_page_config(page_title=APP_TITLE, page_icon="💬", layout="centered")
 set_background()
+start_accrual()
 hero_section()
 
 st.markdown("<div style='display:flex; justify-content:center;'>", unsafe_allow_html=True)
@@ -732,6 +876,8 @@ with col:
         ecotally_page()
     elif st.session_state.page == "budget_summary":
         budget_summary_page()
+    elif st.session_state.page == "goals":
+        goals_page()
     elif st.session_state.page == "finance_chatbot":
         finance_chatbot_page()
 st.markdown("</div>", unsafe_allow_html=True)
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""Static page assets for app.py.
+
+The stylesheet embeds the background image as base64, so it is built once
+per process and shared by every session. serve.py builds it before the
+server starts taking traffic.
+"""
+import base64
+import functools
+
+BG_IMAGE_PATH = "silvia_bg.jpg"  # Optional local image
+BG_IMAGE_URL = ""  # Optional URL background
+
+def _encode_bg(path: str) -> str:
+    try:
+        with open(path, "rb") as f:
+            return base64.b64encode(f.read()).decode("utf-8")
+    except Exception:
+        return ""
+
+@functools.lru_cache(maxsize=None)
+def background_css() -> str:
+    # Built once per process: the base64 image alone is ~100 KB
+    b64 = _encode_bg(BG_IMAGE_PATH) if BG_IMAGE_PATH else ""
+    if b64:
+        bg_css = f"background-image: url('data:image/jpg;base64,{b64}');"
+    elif BG_IMAGE_URL:
+        bg_css = f"background-image: url('{BG_IMAGE_URL}');"
+    else:
+        bg_css = "background-image: radial-gradient(ellipse at top, #524a7b 0%, #1a1a2e 60%, #0f0f1a 100%);"
+
+    return f"""
+        <style>
+            .stApp {{
+                {bg_css}
+                background-size: cover;
+                background-position: center center;
+                background-attachment: fixed;
+            }}
+            .overlay {{
+                position: fixed;
+                inset: 0;
+                background: rgba(10, 12, 22, 0.35);
+                backdrop-filter: blur(1.2px);
+                z-index: 0;
+            }}
+            .glass {{
+                background: rgba(255, 255, 255, 0.08);
+                border: 1px solid rgba(255, 255, 255, 0.18);
+                box-shadow: 0 10px 30px rgba(0,0,0,0.25);
+                backdrop-filter: blur(8px);
+                -webkit-backdrop-filter: blur(8px);
+                border-radius: 16px;
+                padding: 28px;
+            }}
+            .hero h1 {{
+                color: #ffffff;
+                font-weight: 700;
+                letter-spacing: 0.2px;
+                margin-bottom: 6px;
+            }}
+            .chat-message {{
+                padding: 10px;
+                margin: 5px 0;
+                border-radius: 10px;
+                max-width: 80%;
+            }}
+            .user-message {{
+                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                color: white;
+                margin-left: auto;
+                text-align: right;
+            }}
+            .bot-message {{
+                background: rgba(255, 255, 255, 0.15);
+                color: white;
+                margin-right: auto;
+                text-align: left;
+            }}
+            .chat-container {{
+                height: 400px;
+                overflow-y: auto;
+                padding: 20px;
+                background: rgba(255, 255, 255, 0.05);
+                border-radius: 10px;
+                margin: 20px 0;
+            }}
+            footer {{visibility: hidden;}}
+            a {{ text-decoration: none; }}
+            /* Custom styling for account buttons */
+            .account-button {{
+                width: 2.5cm !important;
+                max-width: 2.5cm !important;
+                min-width: 2.5cm !important;
+                height: 32px !important;
+                padding: 4px 8px !important;
+                font-size: 12px !important;
+                margin: 2px 0 !important;
+                text-align: center !important;
+            }}
+            .stButton[data-testid="baseButton-secondary"] > button {{
+                width: 2.5cm !important;
+                max-width: 2.5cm !important;
+                min-width: 2.5cm !important;
+                height: 32px !important;
+                padding: 4px 8px !important;
+                font-size: 12px !important;
+                margin: 2px 0 !important;
+            }}
+        </style>
+        <div class="overlay"></div>
+    """
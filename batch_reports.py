@@ -0,0 +1,209 @@
+"""Nightly budget statements for every account in the store.
+
+    python batch_reports.py                 # reports/<today>/statements.{csv,html}
+    python batch_reports.py --fresh         # discard an interrupted run and start over
+
+Budgets are streamed from the store in key order, one page at a time.
+Summaries are computed in a process pool and appended to the CSV and HTML
+outputs as each page completes. After every page the output sizes and the
+last key are checkpointed. A rerun after an interruption therefore
+truncates the outputs back to the checkpoint and carries on from there.
+Print the HTML statement to get a PDF: its stylesheet paginates for print.
+"""
+import argparse
+import csv
+import html
+import io
+import json
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Dict, Any, Iterator, List, Optional
+
+from accounts import ACCRUALS_JOIN, DB_PATH, SAVED_SQL, connect
+from metrics import MetricsGraph
+
+PAGE_SIZE = 2000
+CHECKPOINT = "checkpoint.json"
+
+CSV_COLUMNS = ["email", "name", "role", "purpose", "target", "saved", "daily_savings", "days_to_goal", "progress_pct"]
+
+HTML_HEAD = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Budget statements {run_date}</title>
+<style>
+    body {{ font-family: sans-serif; color: #1a1a2e; }}
+    .statement {{ border: 1px solid #ccc; border-radius: 8px; padding: 12px 16px; margin: 12px 0; }}
+    .statement h2 {{ margin: 0 0 6px; font-size: 1.1rem; }}
+    .bar {{ background: #eee; border-radius: 4px; height: 8px; }}
+    .bar div {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); height: 8px; border-radius: 4px; }}
+    @media print {{ .statement {{ page-break-inside: avoid; }} }}
+</style></head><body>
+<h1>Budget statements &mdash; {run_date}</h1>
+"""
+HTML_FOOT = "</body></html>\n"
+
+SELECT_PAGE = """
+SELECT b.email_key, u.email, u.first, u.last, b.role, b.pocket, b.salary, b.spending, b.purpose, b.target, {saved}
+FROM {budgets} LEFT JOIN users u ON u.email_key = b.email_key
+WHERE b.email_key > ?
+ORDER BY b.email_key
+LIMIT ?
+""".format(saved=SAVED_SQL, budgets=ACCRUALS_JOIN)
+
+# -----------------------------
+# Summaries (run in worker processes)
+# -----------------------------
+def summarize(rows: List[tuple]) -> List[Dict[str, Any]]:
+    graph = MetricsGraph()
+    out = []
+    for key, email, first, last, role, pocket, salary, spending, purpose, target, saved in rows:
+        graph.update(role=role, pocket=pocket, salary=salary, spending=spending, target=target, saved=saved)
+        days = graph["days_needed"]
+        out.append({
+            "email": email or key,
+            "name": f"{first or ''} {last or ''}".strip(),
+            "role": role,
+            "purpose": purpose,
+            "target": target,
+            "saved": round(saved, 2),
+            "daily_savings": round(graph["daily_savings"], 2),
+            "days_to_goal": "" if math.isinf(days) else max(int(days), 0),
+            "progress_pct": round(graph["progress"] * 100, 1),
+        })
+    return out
+
+def render_csv(summaries: List[Dict[str, Any]]) -> str:
+    buf = io.StringIO()
+    csv.DictWriter(buf, CSV_COLUMNS).writerows(summaries)
+    return buf.getvalue()
+
+def render_html(summaries: List[Dict[str, Any]]) -> str:
+    parts = []
+    for s in summaries:
+        days = "Not reachable at current spending" if s["days_to_goal"] == "" else f"{s['days_to_goal']} days"
+        parts.append(
+            f'<div class="statement"><h2>{html.escape(s["name"] or s["email"])}</h2>'
+            f'<div>{html.escape(s["email"])} &middot; {html.escape(s["role"])}</div>'
+            f'<div><b>Purpose:</b> {html.escape(s["purpose"])}</div>'
+            f'<div><b>Target:</b> ₹{s["target"]:,.2f} &middot; <b>Saved:</b> ₹{s["saved"]:,.2f}'
+            f' &middot; <b>Daily Savings:</b> ₹{s["daily_savings"]:,.2f}</div>'
+            f'<div><b>Days to goal:</b> {days} &middot; <b>Progress:</b> {s["progress_pct"]}%</div>'
+            f'<div class="bar"><div style="width:{s["progress_pct"]}%"></div></div></div>\n'
+        )
+    return "".join(parts)
+
+def build_page(rows: List[tuple]) -> Dict[str, Any]:
+    summaries = summarize(rows)
+    return {"last_key": rows[-1][0], "rows": len(rows),
+            "csv": render_csv(summaries), "html": render_html(summaries)}
+
+# -----------------------------
+# Runner
+# -----------------------------
+def _pages(db_path: str, after: str, page_size: int) -> Iterator[List[tuple]]:
+    conn = connect(db_path)
+    try:
+        while True:
+            rows = [tuple(r) for r in conn.execute(SELECT_PAGE, (after, page_size))]
+            if not rows:
+                return
+            after = rows[-1][0]
+            yield rows
+    finally:
+        conn.close()
+
+def _ordered(pool: ProcessPoolExecutor, pages: Iterator[List[tuple]], workers: int) -> Iterator[Dict[str, Any]]:
+    # Bounded read-ahead keeps memory flat; results come back in key order,
+    # so every checkpoint covers a contiguous prefix of the store
+    in_flight = deque()
+    for rows in pages:
+        in_flight.append(pool.submit(build_page, rows))
+        if len(in_flight) >= workers * 2:
+            yield in_flight.popleft().result()
+    while in_flight:
+        yield in_flight.popleft().result()
+
+def _save_checkpoint(path: str, state: Dict[str, Any]) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def run(out_dir: str, db_path: str = DB_PATH, page_size: int = PAGE_SIZE,
+        workers: Optional[int] = None, fresh: bool = False) -> Dict[str, Any]:
+    os.makedirs(out_dir, exist_ok=True)
+    csv_path = os.path.join(out_dir, "statements.csv")
+    html_path = os.path.join(out_dir, "statements.html")
+    ckpt_path = os.path.join(out_dir, CHECKPOINT)
+    run_date = os.path.basename(os.path.normpath(out_dir))
+
+    state = None
+    if not fresh and os.path.exists(ckpt_path):
+        with open(ckpt_path) as f:
+            state = json.load(f)
+        if state.get("done"):
+            print(f"{out_dir} is already complete; use --fresh to regenerate.")
+            return state
+
+    csv_file = open(csv_path, "r+b" if state else "wb")
+    html_file = open(html_path, "r+b" if state else "wb")
+    try:
+        if state:
+            # Drop anything written after the last checkpoint
+            for f, size in ((csv_file, state["csv_bytes"]), (html_file, state["html_bytes"])):
+                f.truncate(size)
+                f.seek(size)
+            print(f"Resuming after {state['last_key']!r} ({state['rows']:,} rows done)")
+        else:
+            csv_file.write((",".join(CSV_COLUMNS) + "\r\n").encode("utf-8"))
+            html_file.write(HTML_HEAD.format(run_date=html.escape(run_date)).encode("utf-8"))
+            state = {"last_key": "", "rows": 0, "done": False}
+
+        start = time.perf_counter()
+        done_this_run = 0
+        with ProcessPoolExecutor(workers) as pool:
+            for page in _ordered(pool, _pages(db_path, state["last_key"], page_size), workers or os.cpu_count() or 1):
+                csv_file.write(page["csv"].encode("utf-8"))
+                html_file.write(page["html"].encode("utf-8"))
+                csv_file.flush()
+                html_file.flush()
+                done_this_run += page["rows"]
+                state.update(last_key=page["last_key"], rows=state["rows"] + page["rows"],
+                             csv_bytes=csv_file.tell(), html_bytes=html_file.tell())
+                _save_checkpoint(ckpt_path, state)
+                elapsed = time.perf_counter() - start
+                print(f"  {state['rows']:>10,} rows  {done_this_run / elapsed:>10,.0f} rows/s", flush=True)
+
+        html_file.write(HTML_FOOT.encode("utf-8"))
+        state.update(done=True, csv_bytes=csv_file.tell(), html_bytes=html_file.tell())
+        _save_checkpoint(ckpt_path, state)
+    finally:
+        csv_file.close()
+        html_file.close()
+
+    elapsed = time.perf_counter() - start
+    state["seconds"] = elapsed
+    state["rows_per_sec"] = done_this_run / elapsed if elapsed else 0.0
+    return state
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default=DB_PATH, help="account store path")
+    parser.add_argument("--out", default=os.path.join("reports", date.today().isoformat()), help="output directory")
+    parser.add_argument("--page-size", type=int, default=PAGE_SIZE)
+    parser.add_argument("--workers", type=int, default=None, help="summary processes (default: CPU count)")
+    parser.add_argument("--fresh", action="store_true", help="ignore any checkpoint and start over")
+    args = parser.parse_args(argv)
+
+    state = run(args.out, args.db, args.page_size, args.workers, args.fresh)
+    if "seconds" in state:
+        print(f"Wrote {state['rows']:,} statements to {args.out} "
+              f"in {state['seconds']:.1f}s ({state['rows_per_sec']:,.0f} rows/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Shared plumbing for the benchmark tools (loadtest.py, coldstart.py, memory_report.py)
+and the throughput/RSS figures bulk_accounts.py reports.
+
+Each tool runs the app in a scratch working directory, so the real account
+store and chat snapshots are untouched, and stamps its JSON results with the
+current commit for comparison across runs.
+"""
+import contextlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# Files app.py reads from its working directory
+ASSETS = ("silvia_bg.jpg",)
+
+# -----------------------------
+# Environment
+# -----------------------------
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=HERE, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+def peak_rss_mb(children: bool = False) -> Optional[float]:
+    """Peak RSS of this process or, with children, of its largest finished child."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def rss_mb() -> Optional[float]:
+    """Current RSS where /proc has it, else the peak."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except OSError:
+        return peak_rss_mb()
+
+@contextlib.contextmanager
+def scratch_dir(prefix: str, chdir: bool = True) -> Iterator[str]:
+    """A temporary directory holding the app's assets; entered unless chdir is False."""
+    workdir = tempfile.mkdtemp(prefix=prefix)
+    cwd = os.getcwd()
+    try:
+        for asset in ASSETS:
+            if os.path.exists(os.path.join(HERE, asset)):
+                shutil.copy(os.path.join(HERE, asset), workdir)
+        if chdir:
+            os.chdir(workdir)
+        yield workdir
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+# -----------------------------
+# Results
+# -----------------------------
+def save_result(result: Dict[str, Any], out: Optional[str], results_dir: str) -> str:
+    """Write result as JSON to out (default: results_dir/<timestamp>.json); returns the path."""
+    out = os.path.abspath(out or os.path.join(results_dir, time.strftime("%Y%m%d-%H%M%S") + ".json"))
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    with open(out, "w") as f:
+        json.dump(result, f, indent=2)
+    return out
+
+def load_result(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+def compare(baseline: Dict[str, Any], rows: List[Tuple[str, float, Optional[float]]], digits: int = 2) -> None:
+    """Print each (name, now, before) row as a change from baseline."""
+    print(f"\nCompared with {baseline.get('commit') or '?'} ({baseline.get('timestamp')}):")
+    width = max(len(name) for name, _, _ in rows) + 2
+    for name, now, before in rows:
+        if before:
+            print(f"  {name:<{width}} {before:>10.{digits}f} -> {now:>10.{digits}f} ({(now - before) / before * 100:+.1f}%)")
+        else:
+            print(f"  {name:<{width}} {'-':>10} -> {now:>10.{digits}f}")
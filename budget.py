@@ -0,0 +1,35 @@
+from types import MappingProxyType
+
+import numpy as np
+
+# -----------------------------
+# Configuration
+# -----------------------------
+# Shared by every session that has not answered the predefined questions yet
+EMPTY_BUDGET = MappingProxyType({})
+
+# What-if sweep axes, in percent
+SPEND_CUTS = np.arange(0, 101, 5)   # reduce daily spending by 0..100%
+INCOME_CUTS = np.arange(0, 51, 5)   # reduce daily income by 0..50%
+
+# -----------------------------
+# Budget Helpers
+# -----------------------------
+def daily_income(role: str, pocket: float, salary: float, days_per_month: int) -> float:
+    if role == "Student":
+        return pocket
+    return salary / days_per_month
+
+def days_to_goal_grid(income: float, spending: float, target: float, saved: float) -> np.ndarray:
+    """Days to reach the target for every (income cut, spending cut) pair.
+
+    Rows follow INCOME_CUTS and columns SPEND_CUTS; cells where nothing is
+    saved per day are inf.
+    """
+    incomes = income * (1 - INCOME_CUTS / 100)[:, None]
+    spends = spending * (1 - SPEND_CUTS / 100)[None, :]
+    savings = incomes - spends
+    remaining = max(target - saved, 0.0)
+    days = np.full(savings.shape, np.inf)
+    np.divide(remaining, savings, out=days, where=savings > 0)
+    return days
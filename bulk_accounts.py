@@ -0,0 +1,188 @@
+"""Bulk account import/export for the account store.
+
+    python bulk_accounts.py import students.csv [--rejects rejects.csv]
+    python bulk_accounts.py export accounts.csv
+
+Import CSV columns: first, last, email, password, [confirm], role, core, industry.
+A `password_hash` column (as written by export) may be given instead of `password`.
+Both commands report throughput and peak RSS. For import, peak_rss_mb is the
+parent process and peak_worker_rss_mb the largest of the hashing workers.
+"""
+import argparse
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+from accounts import (
+    DB_PATH, INSERT_USER_SQL, connect, email_valid, passwords_ok, hash_password, is_password_hash,
+)
+from bench import peak_rss_mb
+
+BATCH_SIZE = 5000
+EXPORT_COLUMNS = ["first", "last", "email", "password_hash", "role", "core", "industry"]
+
+# -----------------------------
+# Helpers
+# -----------------------------
+def _batched(it: Iterable, n: int) -> Iterator[List]:
+    it = iter(it)
+    while True:
+        chunk = list(islice(it, n))
+        if not chunk:
+            return
+        yield chunk
+
+def _clean(row: Dict[str, Any], key: str) -> str:
+    return (row.get(key) or "").strip()
+
+def validate_row(row: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], str]:
+    """Apply the same checks as signup_card; returns (profile, "") or (None, error)."""
+    first, last, email = _clean(row, "first"), _clean(row, "last"), _clean(row, "email")
+    role = _clean(row, "role").capitalize()
+    core, industry = _clean(row, "core"), _clean(row, "industry")
+
+    if not first or not last:
+        return None, "Missing first or last name."
+    if not email_valid(email):
+        return None, "Invalid email address."
+    if role not in ("Student", "Professional"):
+        return None, "Role must be Student or Professional."
+    if role == "Student" and not core:
+        return None, "Missing Core."
+    if role == "Professional" and not industry:
+        return None, "Missing Industry Name."
+
+    profile = {"first": first, "last": last, "email": email, "role": role,
+               "core": core if role == "Student" else None,
+               "industry": industry if role == "Professional" else None}
+
+    pw = row.get("password") or ""
+    if not pw and is_password_hash(_clean(row, "password_hash")):
+        profile["password_hash"] = _clean(row, "password_hash")
+        return profile, ""
+    msg = passwords_ok(pw, row.get("confirm") or pw)
+    if msg:
+        return None, msg
+    profile["password"] = pw
+    return profile, ""
+
+# -----------------------------
+# Import
+# -----------------------------
+def _hash_batch(pool: ProcessPoolExecutor, profiles: List[Dict[str, Any]], workers: int) -> None:
+    todo = [p for p in profiles if "password_hash" not in p]
+    chunksize = max(1, len(todo) // (workers * 4))
+    for p, h in zip(todo, pool.map(hash_password, [p.pop("password") for p in todo], chunksize=chunksize)):
+        p["password_hash"] = h
+
+def import_accounts(csv_path: str, db_path: str = DB_PATH, batch_size: int = BATCH_SIZE,
+                    workers: Optional[int] = None, rejects_path: Optional[str] = None) -> Dict[str, Any]:
+    workers = workers or os.cpu_count() or 1
+    conn = connect(db_path)
+    stats = {"rows": 0, "inserted": 0, "duplicates": 0, "rejected": 0}
+    start = time.perf_counter()
+
+    rejects_file = open(rejects_path, "w", newline="", encoding="utf-8") if rejects_path else None
+    rejects = csv.writer(rejects_file) if rejects_file else None
+    if rejects:
+        rejects.writerow(["line", "email", "error"])
+
+    try:
+        with open(csv_path, newline="", encoding="utf-8-sig") as f, ProcessPoolExecutor(workers) as pool:
+            reader = csv.DictReader(f)
+            numbered = ((reader.line_num, row) for row in reader)
+            for chunk in _batched(numbered, batch_size):
+                profiles = []
+                for line_num, row in chunk:
+                    stats["rows"] += 1
+                    profile, err = validate_row(row)
+                    if profile is None:
+                        stats["rejected"] += 1
+                        if rejects:
+                            rejects.writerow([line_num, row.get("email", ""), err])
+                        continue
+                    profiles.append(profile)
+
+                _hash_batch(pool, profiles, workers)
+                before = conn.total_changes
+                with conn:  # one transaction per batch
+                    conn.executemany(INSERT_USER_SQL, (
+                        (p["email"].lower(), p["email"], p["first"], p["last"], p["password_hash"],
+                         p["role"], p["core"], p["industry"]) for p in profiles
+                    ))
+                inserted = conn.total_changes - before
+                stats["inserted"] += inserted
+                stats["duplicates"] += len(profiles) - inserted
+    finally:
+        conn.close()
+        if rejects_file:
+            rejects_file.close()
+
+    stats["seconds"] = time.perf_counter() - start
+    stats["rows_per_sec"] = stats["rows"] / stats["seconds"] if stats["seconds"] else 0.0
+    stats["peak_rss_mb"] = peak_rss_mb()
+    # Hashing runs in the worker processes, which have all exited by now
+    stats["peak_worker_rss_mb"] = peak_rss_mb(children=True)
+    return stats
+
+# -----------------------------
+# Export
+# -----------------------------
+def export_accounts(csv_path: str, db_path: str = DB_PATH) -> Dict[str, Any]:
+    conn = connect(db_path)
+    stats = {"rows": 0}
+    start = time.perf_counter()
+    try:
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(EXPORT_COLUMNS)
+            # Iterate the cursor so rows are streamed, never loaded all at once
+            cur = conn.execute(f"SELECT {', '.join(EXPORT_COLUMNS)} FROM users ORDER BY email_key")
+            for row in cur:
+                writer.writerow(["" if v is None else v for v in row])
+                stats["rows"] += 1
+    finally:
+        conn.close()
+
+    stats["seconds"] = time.perf_counter() - start
+    stats["rows_per_sec"] = stats["rows"] / stats["seconds"] if stats["seconds"] else 0.0
+    stats["peak_rss_mb"] = peak_rss_mb()
+    return stats
+
+# -----------------------------
+# CLI
+# -----------------------------
+def _print_stats(stats: Dict[str, Any]) -> None:
+    for key, value in stats.items():
+        if isinstance(value, float):
+            value = f"{value:,.2f}"
+        elif value is None:
+            value = "n/a"
+        print(f"{key:>18}: {value}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default=DB_PATH, help="account store path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    imp = sub.add_parser("import", help="import accounts from CSV")
+    imp.add_argument("csv")
+    imp.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    imp.add_argument("--workers", type=int, default=None, help="hashing processes (default: CPU count)")
+    imp.add_argument("--rejects", default=None, help="write rejected rows with reasons to this CSV")
+
+    exp = sub.add_parser("export", help="export accounts to CSV")
+    exp.add_argument("csv")
+
+    args = parser.parse_args(argv)
+    if args.command == "import":
+        stats = import_accounts(args.csv, args.db, args.batch_size, args.workers, args.rejects)
+    else:
+        stats = export_accounts(args.csv, args.db)
+    _print_stats(stats)
+
+if __name__ == "__main__":
+    main()
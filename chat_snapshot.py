@@ -0,0 +1,232 @@
+"""Append-only binary snapshots of chatbot state and history.
+
+File layout (little-endian):
+
+    header  : magic b"PMCS", version u8
+    record  : type u8, key_len u16, payload_len u32, key (utf-8), payload
+
+    TURN    payload: sender u8 (0 user, 1 bot), message (utf-8)
+    STATE   payload: STATE_STRUCT (fixed layout), then idea (utf-8)
+    RESET   payload: empty - clears the session's history and state
+
+Every chat turn appends one TURN per message plus one STATE, so saving is
+O(1) per message. Loading replays the log into per-session
+(history, state) pairs; a truncated final record (crash mid-write) is dropped.
+"""
+import math
+import os
+import struct
+import sys
+import threading
+from typing import Dict, Any, List, Tuple, Iterable
+
+SNAPSHOT_PATH = "chat_snapshots.bin"
+
+MAGIC = b"PMCS"
+VERSION = 1
+
+HEADER = struct.Struct("<4sB")
+RECORD = struct.Struct("<BHI")
+# step, mode, senior, budget, deposit, years, salary, spending
+STATE_STRUCT = struct.Struct("<BBb5d")
+
+REC_TURN = 1
+REC_STATE = 2
+REC_RESET = 3
+
+MODES = (None, "business", "interest", "profit")
+SENDERS = ("user", "bot")
+FLOAT_FIELDS = ("budget", "deposit", "years", "salary", "spending")
+
+# Rewrite the log on open once superseded records outnumber live ones by this factor
+COMPACT_RATIO = 4
+
+class ChatState:
+    """Chatbot conversation state with dict-style access, in a fraction of a dict's memory."""
+    __slots__ = ("step", "mode", "idea", "budget", "deposit", "years", "senior", "salary", "spending")
+
+    def __init__(self, step: int = 0, **values: Any):
+        self.step = step
+        for name in self.__slots__[1:]:
+            setattr(self, name, values.get(name))
+
+    def __getitem__(self, name: str) -> Any:
+        return getattr(self, name)
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        setattr(self, name, value)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return getattr(self, name, default)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.__slots__
+
+    def copy(self) -> "ChatState":
+        return ChatState(**{name: getattr(self, name) for name in self.__slots__})
+
+    def __eq__(self, other: Any) -> bool:
+        return all(self[k] == other.get(k) for k in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"ChatState({', '.join(f'{k}={getattr(self, k)!r}' for k in self.__slots__)})"
+
+def new_state() -> ChatState:
+    return ChatState()
+
+# -----------------------------
+# Encoding
+# -----------------------------
+def pack_state(state: ChatState) -> bytes:
+    senior = -1 if state.get("senior") is None else int(bool(state["senior"]))
+    floats = [math.nan if state.get(k) is None else float(state[k]) for k in FLOAT_FIELDS]
+    fixed = STATE_STRUCT.pack(state.get("step", 0), MODES.index(state.get("mode")), senior, *floats)
+    idea = state.get("idea")
+    return fixed + (b"" if idea is None else b"\x01" + idea.encode("utf-8"))
+
+def unpack_state(buf: bytes) -> ChatState:
+    step, mode, senior, *floats = STATE_STRUCT.unpack_from(buf)
+    state = new_state()
+    state["step"] = step
+    state["mode"] = MODES[mode]
+    state["senior"] = None if senior < 0 else bool(senior)
+    for k, v in zip(FLOAT_FIELDS, floats):
+        state[k] = None if math.isnan(v) else v
+    rest = buf[STATE_STRUCT.size:]
+    state["idea"] = bytes(rest[1:]).decode("utf-8") if rest else None
+    return state
+
+def _record(kind: int, key: bytes, payload: bytes = b"") -> bytes:
+    return RECORD.pack(kind, len(key), len(payload)) + key + payload
+
+def _turn_payload(turn: Tuple[str, str]) -> bytes:
+    sender, message = turn
+    return bytes((SENDERS.index(sender),)) + message.encode("utf-8")
+
+# -----------------------------
+# Snapshot log
+# -----------------------------
+class SnapshotLog:
+    def __init__(self, path: str):
+        self.path = path
+        self.sessions: Dict[str, Tuple[List[Tuple[str, str]], ChatState]] = {}
+        self._lock = threading.Lock()
+        self._records = 0
+        self._file = None
+        self._load()
+        live = sum(len(history) + 1 for history, _ in self.sessions.values())
+        if self._records > COMPACT_RATIO * max(live, 1):
+            self._compact()
+        self._file = open(self.path, "ab")
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            with open(self.path, "wb") as f:
+                f.write(HEADER.pack(MAGIC, VERSION))
+            return
+
+        with open(self.path, "rb") as f:
+            data = f.read()
+        magic, version = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a chat snapshot file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported chat snapshot version {version} (expected {VERSION})")
+
+        view = memoryview(data)
+        sessions = self.sessions
+        # Only the last STATE per session matters; decode those after the replay
+        states: Dict[str, memoryview] = {}
+        pos, end = HEADER.size, len(data)
+        while pos + RECORD.size <= end:
+            kind, key_len, payload_len = RECORD.unpack_from(view, pos)
+            body = pos + RECORD.size
+            stop = body + key_len + payload_len
+            if stop > end:
+                break
+            key = bytes(view[body:body + key_len]).decode("utf-8")
+            payload = view[body + key_len:stop]
+            entry = sessions.get(key)
+            if entry is None:
+                entry = sessions[key] = ([], new_state())
+            if kind == REC_TURN:
+                sender, message = SENDERS[payload[0]], bytes(payload[1:]).decode("utf-8")
+                # Bot prompts repeat across sessions; intern them so restored histories share one copy
+                entry[0].append((sender, sys.intern(message) if sender == "bot" else message))
+            elif kind == REC_STATE:
+                states[key] = payload
+            elif kind == REC_RESET:
+                # A reset conversation starts over from the greeting, not from its last state
+                sessions[key] = ([], new_state())
+                states.pop(key, None)
+            pos = stop
+            self._records += 1
+
+        for key, payload in states.items():
+            sessions[key] = (sessions[key][0], unpack_state(payload))
+
+        if pos != end:
+            # Drop the partially written tail so new records stay aligned
+            with open(self.path, "r+b") as f:
+                f.truncate(pos)
+
+    def _write(self, chunks: Iterable[bytes]) -> None:
+        # One write per delta keeps each turn's records contiguous in the file
+        self._file.write(b"".join(chunks))
+        self._file.flush()
+
+    def append_delta(self, key: str, turns: List[Tuple[str, str]], state: ChatState) -> None:
+        kb = key.encode("utf-8")
+        with self._lock:
+            self._write([*(_record(REC_TURN, kb, _turn_payload(t)) for t in turns),
+                         _record(REC_STATE, kb, pack_state(state))])
+            history = self.sessions.get(key, ([], None))[0]
+            history.extend(turns)
+            self.sessions[key] = (history, state.copy())
+            self._records += len(turns) + 1
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._write([_record(REC_RESET, key.encode("utf-8"))])
+            if key in self.sessions:
+                self.sessions[key] = ([], new_state())
+            self._records += 1
+
+    def restore(self, key: str) -> Tuple[List[Tuple[str, str]], ChatState]:
+        with self._lock:
+            history, state = self.sessions.get(key, ([], new_state()))
+            return list(history), state.copy()
+
+    def compact(self) -> None:
+        with self._lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        # Rewrite as one STATE plus the live turns per session, then swap atomically
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION))
+            records = 0
+            for key, (history, state) in self.sessions.items():
+                kb = key.encode("utf-8")
+                f.write(b"".join(_record(REC_TURN, kb, _turn_payload(t)) for t in history))
+                f.write(_record(REC_STATE, kb, pack_state(state)))
+                records += len(history) + 1
+        os.replace(tmp, self.path)
+        self._records = records
+        if self._file is not None:
+            self._file.close()
+            self._file = open(self.path, "ab")
+
+    def close(self) -> None:
+        self._file.close()
+
+_shared: Dict[str, SnapshotLog] = {}
+_shared_lock = threading.Lock()
+
+def shared_log(path: str = SNAPSHOT_PATH) -> SnapshotLog:
+    """The process-wide log for `path`, replayed on first use."""
+    with _shared_lock:
+        if path not in _shared:
+            _shared[path] = SnapshotLog(path)
+        return _shared[path]
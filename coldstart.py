@@ -0,0 +1,156 @@
+"""Cold-start benchmark and deploy gate for app.py.
+
+    python coldstart.py                          # serve.py; fail if first render > --budget
+    python coldstart.py --runs 5 --budget 0.8
+    python coldstart.py --no-warmup              # plain `streamlit run app.py`, for comparison
+    python coldstart.py --compare coldstart_results/20261018-120000.json
+
+Each run starts a fresh server process in a scratch working directory and
+measures:
+
+    ready         process start -> /_stcore/health answers
+    first_render  the first session's script run, request -> script_finished
+    warm_render   median of the next --renders sessions
+
+A session is a websocket client speaking streamlit's protocol, like a browser
+tab that has just loaded the page. The exit status is 1 when the median
+first_render over --runs is above --budget (or ready is above --ready-budget),
+so a deploy pipeline can fail on a cold-start regression. Results are written
+as JSON under coldstart_results/ for comparison across runs.
+"""
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Dict, Any, List
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+import bench
+from bench import HERE
+
+RESULTS_DIR = os.path.join(HERE, "coldstart_results")
+FIRST_RENDER_BUDGET = 1.0  # seconds
+READY_TIMEOUT = 60.0
+
+# -----------------------------
+# Helpers
+# -----------------------------
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def _server_command(port: int, warmup: bool) -> List[str]:
+    flags = ["--server.headless", "true", "--server.port", str(port),
+             "--server.enableXsrfProtection", "false", "--browser.gatherUsageStats", "false"]
+    if warmup:
+        return [sys.executable, os.path.join(HERE, "serve.py"), *flags]
+    return [sys.executable, "-m", "streamlit", "run", os.path.join(HERE, "app.py"), *flags]
+
+def _wait_ready(proc: subprocess.Popen, port: int) -> None:
+    deadline = time.monotonic() + READY_TIMEOUT
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server exited with status {proc.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return
+        except OSError:
+            time.sleep(0.02)
+    raise RuntimeError(f"server not ready after {READY_TIMEOUT:.0f}s")
+
+async def _render(port: int) -> float:
+    # One new session: ask for a script run and wait until it has finished
+    async with websockets.connect(f"ws://127.0.0.1:{port}/_stcore/stream",
+                                  subprotocols=["streamlit"], max_size=None) as ws:
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        start = time.perf_counter()
+        await ws.send(msg.SerializeToString())
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await ws.recv())
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.new_element.WhichOneof("type") == "exception":
+                raise RuntimeError(f"app raised: {fwd.delta.new_element.exception.message}")
+            if kind == "script_finished":
+                if fwd.script_finished != ForwardMsg.FINISHED_SUCCESSFULLY:
+                    raise RuntimeError(f"script finished with status {fwd.script_finished}")
+                return time.perf_counter() - start
+
+# -----------------------------
+# Runner
+# -----------------------------
+def measure_once(warmup: bool, renders: int) -> Dict[str, float]:
+    with bench.scratch_dir("coldstart-", chdir=False) as workdir:
+        port = _free_port()
+        start = time.perf_counter()
+        proc = subprocess.Popen(_server_command(port, warmup), cwd=workdir,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            _wait_ready(proc, port)
+            ready = time.perf_counter() - start
+            first = asyncio.run(_render(port))
+            warm = [asyncio.run(_render(port)) for _ in range(renders)]
+        finally:
+            proc.terminate()
+            proc.wait()
+    return {"ready_s": ready, "first_render_s": first,
+            "warm_render_s": statistics.median(warm) if warm else 0.0}
+
+def run(runs: int, renders: int, warmup: bool) -> Dict[str, Any]:
+    samples = [measure_once(warmup, renders) for _ in range(runs)]
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": bench.git_commit(),
+        "python": sys.version.split()[0],
+        "warmup": warmup,
+        "runs": samples,
+        **{key: statistics.median(s[key] for s in samples) for key in samples[0]},
+    }
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    bench.compare(baseline, [(key, current[key], baseline.get(key))
+                             for key in ("ready_s", "first_render_s", "warm_render_s")], digits=3)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="fresh server processes to measure")
+    parser.add_argument("--renders", type=int, default=3, help="sessions after the first, per run")
+    parser.add_argument("--budget", type=float, default=FIRST_RENDER_BUDGET, help="max median first_render (s)")
+    parser.add_argument("--ready-budget", type=float, default=None, help="max median ready time (s)")
+    parser.add_argument("--no-warmup", action="store_true", help="start with `streamlit run app.py` instead of serve.py")
+    parser.add_argument("--compare", default=None, help="earlier result JSON to compare against")
+    parser.add_argument("--out", default=None, help="result path (default: coldstart_results/<timestamp>.json)")
+    args = parser.parse_args(argv)
+
+    result = run(args.runs, args.renders, not args.no_warmup)
+    out = bench.save_result(result, args.out, RESULTS_DIR)
+
+    print(f"{'run':<6}{'ready':>10}{'first':>10}{'warm':>10}  (s)")
+    for i, s in enumerate(result["runs"], 1):
+        print(f"{i:<6}{s['ready_s']:>10.3f}{s['first_render_s']:>10.3f}{s['warm_render_s']:>10.3f}")
+    print(f"{'median':<6}{result['ready_s']:>10.3f}{result['first_render_s']:>10.3f}{result['warm_render_s']:>10.3f}")
+    if args.compare:
+        compare(result, bench.load_result(args.compare))
+    print(f"\nSaved {out}")
+
+    failures = []
+    if result["first_render_s"] > args.budget:
+        failures.append(f"first render {result['first_render_s']:.3f}s is over the {args.budget:.3f}s budget")
+    if args.ready_budget is not None and result["ready_s"] > args.ready_budget:
+        failures.append(f"ready {result['ready_s']:.3f}s is over the {args.ready_budget:.3f}s budget")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -14,31 +14,18 @@ import gradio as gr
 import random
 import re
 
+from finance_config import get_config, growth_factor, monthly_tax
+
 # ---------- Helpers ----------
+NUMBER_RE = re.compile(r"(\d+(\.\d+)?)")
+
 def extract_number(text):
-    m = re.search(r"(\d+(\.\d+)?)", str(text).replace(",", ""))
+    m = NUMBER_RE.search(str(text).replace(",", ""))
     return float(m.group(1)) if m else None
 
 def format_inr(x):
     return f"₹{int(x):,}" if abs(x - int(x)) < 0.01 else f"₹{x:,.2f}"
 
-def monthly_tax(income):
-    annual = income * 12
-    tax = 0
-    if annual <= 250000:
-        tax = 0
-    elif annual <= 500000:
-        tax = (annual - 250000) * 0.05
-    elif annual <= 1000000:
-        tax = 250000*0.05 + (annual - 500000)*0.2
-    else:
-        tax = 250000*0.05 + 500000*0.2 + (annual - 1000000)*0.3
-    return round(tax/12,2)
-
-def compound_amount(P, rate, years):
-    A = P * ((1 + rate) ** years)
-    return round(A,2)
-
 # ---------- Main Bot ----------
 def simple_finance_bot(user_msg, chat_history=None, state=None):
     if chat_history is None:
@@ -114,8 +101,8 @@ def simple_finance_bot(user_msg, chat_history=None, state=None):
             return chat_history, state, ""
         if state["step"] == 12:
             state["senior"] = True if "yes" in text else False
-            rate = 0.08 if state["senior"] else 0.06
-            A = compound_amount(state["deposit"], rate, state["years"])
+            rate = get_config().deposit_rate(state["senior"])
+            A = round(state["deposit"] * growth_factor(state["senior"], state["years"]), 2)
             monthly = round(A/(state["years"]*12),2)
             add(("bot", f"Deposit: {format_inr(state['deposit'])}\nYears: {state['years']}\nRate: {rate*100:.1f}%\nTotal after {state['years']} years: {format_inr(A)}\nMonthly average: {format_inr(monthly)}"))
             state["step"] = 99
@@ -0,0 +1,140 @@
+"""Hot-reloadable finance configuration.
+
+Tax slabs, deposit rates and the days-per-month assumption are read from
+finance_config.json. The file is re-checked at most every CHECK_INTERVAL
+seconds. Each parse is stamped with a version (a hash of the file contents).
+Tables derived from it, such as the tax table, are rebuilt with every new
+version. Caches keyed on config.version or wrapped in versioned_cache() drop
+their entries when the version changes, so rates can be edited under live
+traffic without a restart. A file that fails to parse is reported and the
+last good config stays in use.
+"""
+import functools
+import hashlib
+import json
+import math
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Optional, Tuple
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "finance_config.json")
+CHECK_INTERVAL = 2.0  # seconds between mtime checks
+
+DEFAULTS: Dict[str, Any] = {
+    "days_per_month": 30,
+    "deposit_rates": {"regular": 0.06, "senior": 0.08},
+    "tax_slabs": [
+        {"up_to": 250000, "rate": 0.0},
+        {"up_to": 500000, "rate": 0.05},
+        {"up_to": 1000000, "rate": 0.2},
+        {"up_to": None, "rate": 0.3},
+    ],
+}
+
+# -----------------------------
+# Config snapshot
+# -----------------------------
+class FinanceConfig:
+    __slots__ = ("version", "days_per_month", "regular_rate", "senior_rate", "tax_uppers", "tax_table")
+
+    def __init__(self, raw: Dict[str, Any], version: str):
+        self.version = version
+        self.days_per_month = int(raw["days_per_month"])
+        self.regular_rate = float(raw["deposit_rates"]["regular"])
+        self.senior_rate = float(raw["deposit_rates"]["senior"])
+        if self.days_per_month <= 0:
+            raise ValueError("days_per_month must be positive")
+
+        # (lower, rate, tax owed below lower) per slab, looked up by annual income
+        uppers, table, lower, base = [], [], 0.0, 0.0
+        for slab in raw["tax_slabs"]:
+            upper = math.inf if slab["up_to"] is None else float(slab["up_to"])
+            if upper <= lower:
+                raise ValueError("tax_slabs must be in increasing order")
+            rate = float(slab["rate"])
+            uppers.append(upper)
+            table.append((lower, rate, base))
+            base += (upper - lower) * rate if upper != math.inf else 0.0
+            lower = upper
+        if not uppers or uppers[-1] != math.inf:
+            raise ValueError("the last tax slab must have up_to: null")
+        self.tax_uppers: Tuple[float, ...] = tuple(uppers)
+        self.tax_table: Tuple[Tuple[float, float, float], ...] = tuple(table)
+
+    def deposit_rate(self, senior: bool) -> float:
+        return self.senior_rate if senior else self.regular_rate
+
+_lock = threading.Lock()
+_config: Optional[FinanceConfig] = None
+_mtime: Optional[float] = None
+_checked = 0.0
+
+def _load(path: str) -> FinanceConfig:
+    try:
+        with open(path, "rb") as f:
+            content = f.read()
+    except FileNotFoundError:
+        content = json.dumps(DEFAULTS, sort_keys=True).encode("utf-8")
+    return FinanceConfig(json.loads(content), hashlib.sha256(content).hexdigest()[:12])
+
+def get_config() -> FinanceConfig:
+    global _config, _mtime, _checked
+    # One process-wide config, read from CONFIG_PATH
+    path = CONFIG_PATH
+    now = time.monotonic()
+    if _config is not None and now - _checked < CHECK_INTERVAL:
+        return _config
+    with _lock:
+        if _config is not None and now - _checked < CHECK_INTERVAL:
+            return _config
+        _checked = now
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if _config is None or mtime != _mtime:
+            try:
+                _config = _load(path)
+                _mtime = mtime
+            except (ValueError, KeyError, TypeError) as e:
+                if _config is None:
+                    raise
+                print(f"finance_config: keeping version {_config.version}, {path} is invalid: {e}", file=sys.stderr)
+        return _config
+
+# -----------------------------
+# Versioned caches
+# -----------------------------
+def versioned_cache(maxsize: int = 1024) -> Callable:
+    """lru_cache that clears itself whenever the config version changes."""
+    def decorate(fn):
+        cached = functools.lru_cache(maxsize=maxsize)(fn)
+        seen = [None]
+
+        @functools.wraps(fn)
+        def wrapper(*args):
+            version = get_config().version
+            if version != seen[0]:
+                cached.cache_clear()
+                seen[0] = version
+            return cached(*args)
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorate
+
+# -----------------------------
+# Finance Helpers
+# -----------------------------
+def monthly_tax(income):
+    cfg = get_config()
+    annual = income * 12
+    lower, rate, base = cfg.tax_table[bisect_left(cfg.tax_uppers, annual)]
+    tax = base + (annual - lower) * rate if annual > 0 else 0
+    return round(tax/12,2)
+
+@versioned_cache()
+def growth_factor(senior: bool, years: float) -> float:
+    return (1 + get_config().deposit_rate(senior)) ** years
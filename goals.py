@@ -0,0 +1,134 @@
+import math
+from bisect import bisect_left, insort
+from datetime import date
+from typing import Dict, Any, List, Optional, Tuple
+
+# -----------------------------
+# Goal Helpers
+# -----------------------------
+# A goal is a plain dict, as stored in budget_data["goals"]:
+#   {"purpose": str, "target": float, "saved": float,
+#    "deadline": "YYYY-MM-DD" or None, "priority": int (1 = most important)}
+
+def remaining(goal: Dict[str, Any]) -> float:
+    return max(goal.get("target", 0) - goal.get("saved", 0), 0.0)
+
+def days_left(goal: Dict[str, Any], today: date) -> Optional[int]:
+    if not goal.get("deadline"):
+        return None
+    # An overdue goal is planned as due tomorrow rather than dropped
+    return max((date.fromisoformat(goal["deadline"]) - today).days, 1)
+
+def required_rate(goal: Dict[str, Any], today: date) -> float:
+    left = days_left(goal, today)
+    return remaining(goal) / left if left else 0.0
+
+# -----------------------------
+# Planner
+# -----------------------------
+class GoalPlanner:
+    """Splits a daily savings budget across many goals.
+
+    Goals are funded in (priority, deadline) order at the daily rate needed to
+    hit their deadline. If a priority tier cannot be fully funded, what is left
+    is water-filled across that tier: every goal gets the same share of its
+    required rate, the max-min optimum of the allocation LP. Money left after
+    all deadlines are covered is split across unfinished goals by priority
+    weight (1/priority).
+
+    The sort order and per-tier totals are maintained on every upsert/remove,
+    so re-planning after one change is a single linear pass without re-sorting.
+    """
+
+    def __init__(self, goals: List[Dict[str, Any]] = (), today: Optional[date] = None):
+        self.today = today or date.today()
+        self._goals: Dict[str, Dict[str, Any]] = {}
+        self._required: Dict[str, float] = {}
+        self._order: List[Tuple[int, str, str]] = []
+        self._tier_required: Dict[int, float] = {}
+        self._weight = 0.0
+        self._cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        for goal in goals:
+            self.upsert(goal)
+
+    @staticmethod
+    def _key(goal: Dict[str, Any]) -> Tuple[int, str, str]:
+        return (int(goal.get("priority", 1)), goal.get("deadline") or "9999-12-31", goal["purpose"])
+
+    @staticmethod
+    def _weight_of(goal: Dict[str, Any]) -> float:
+        return 1 / max(int(goal.get("priority", 1)), 1) if remaining(goal) > 0 else 0.0
+
+    def __len__(self) -> int:
+        return len(self._goals)
+
+    def goals(self) -> List[Dict[str, Any]]:
+        return [self._goals[name] for _, _, name in self._order]
+
+    def get(self, purpose: str) -> Optional[Dict[str, Any]]:
+        return self._goals.get(purpose)
+
+    def upsert(self, goal: Dict[str, Any]) -> None:
+        goal = dict(goal)
+        self.remove(goal["purpose"])
+        key = self._key(goal)
+        rate = required_rate(goal, self.today)
+        self._goals[goal["purpose"]] = goal
+        self._required[goal["purpose"]] = rate
+        insort(self._order, key)
+        self._tier_required[key[0]] = self._tier_required.get(key[0], 0.0) + rate
+        self._weight += self._weight_of(goal)
+        self._cache = None
+
+    def remove(self, purpose: str) -> None:
+        goal = self._goals.pop(purpose, None)
+        if goal is None:
+            return
+        key = self._key(goal)
+        del self._order[bisect_left(self._order, key)]
+        rate = self._required.pop(purpose)
+        self._tier_required[key[0]] -= rate
+        i = bisect_left(self._order, (key[0],))
+        if i == len(self._order) or self._order[i][0] != key[0]:
+            del self._tier_required[key[0]]
+        self._weight = self._weight - self._weight_of(goal) if self._goals else 0.0
+        self._cache = None
+
+    def plan(self, daily_budget: float) -> List[Dict[str, Any]]:
+        daily_budget = max(daily_budget, 0.0)
+        if self._cache and self._cache[0] == daily_budget:
+            return self._cache[1]
+
+        left = daily_budget
+        fraction = {}
+        for tier in sorted(self._tier_required):
+            need = self._tier_required[tier]
+            if need <= left:
+                fraction[tier] = 1.0
+                left -= need
+            else:
+                fraction[tier] = left / need if need > 0 else 0.0
+                left = 0.0
+        surplus = left / self._weight if self._weight > 0 else 0.0
+
+        rows = []
+        for tier, _, name in self._order:
+            goal = self._goals[name]
+            rate = self._required[name]
+            allocated = rate * fraction[tier] + surplus * self._weight_of(goal)
+            rest = remaining(goal)
+            days = 0.0 if rest == 0 else (rest / allocated if allocated > 0 else math.inf)
+            due = days_left(goal, self.today)
+            rows.append({
+                "purpose": name,
+                "priority": tier,
+                "deadline": goal.get("deadline"),
+                "target": goal.get("target", 0),
+                "saved": goal.get("saved", 0),
+                "required": rate,
+                "allocated": allocated,
+                "days": days,
+                "on_track": math.isfinite(days) and (due is None or days <= due),
+            })
+        self._cache = (daily_budget, rows)
+        return rows
@@ -0,0 +1,233 @@
+"""Multi-session load test for app.py using streamlit's AppTest.
+
+    python loadtest.py --sessions 20 --think 0.5
+    python loadtest.py --sessions 20 --compare loadtest_results/20261018-120000.json
+
+Each simulated session logs in as its own seeded account and walks
+login -> predefined_questions -> dashboard -> chatbot -> ecotally ->
+budget_summary, sleeping a random think time between actions. AppTest keeps a
+process-global runtime, so reruns are serialized behind a lock. That mirrors one
+GIL-bound server process: latency includes the time spent queued behind other
+sessions, and "service" is the rerun time alone. The app runs in
+a scratch working directory so the real account store and chat snapshots are
+untouched. One untimed session walks first, so per-session CPU and RSS
+exclude one-time imports and process-wide caches. Results (rerun latency
+percentiles, CPU and RSS per session) are written as JSON under
+loadtest_results/ for comparison across runs.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List
+
+from streamlit.testing.v1 import AppTest
+
+import accounts
+import bench
+from bench import HERE
+
+APP_PATH = os.path.join(HERE, "app.py")
+RESULTS_DIR = os.path.join(HERE, "loadtest_results")
+PASSWORD = "loadtest-pw"
+
+RUN_LOCK = threading.Lock()
+
+# -----------------------------
+# Helpers
+# -----------------------------
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+    return {"count": len(ordered), "mean_ms": statistics.fmean(ordered) * 1000,
+            "p50_ms": pick(0.50) * 1000, "p90_ms": pick(0.90) * 1000,
+            "p99_ms": pick(0.99) * 1000, "max_ms": ordered[-1] * 1000}
+
+def seed_accounts(n: int) -> List[str]:
+    conn = accounts.connect()
+    emails = [f"loadtest-{i}@example.com" for i in range(n)]
+    # Every account shares one password, so hash it once
+    password_hash = accounts.hash_password(PASSWORD)
+    with conn:
+        conn.executemany(accounts.INSERT_USER_SQL, [
+            (e, e, f"Load{i}", "Test", password_hash, "Student" if i % 2 == 0 else "Professional",
+             "CSE" if i % 2 == 0 else None, None if i % 2 == 0 else "IT")
+            for i, e in enumerate(emails)
+        ])
+    conn.close()
+    return emails
+
+# -----------------------------
+# Simulated session
+# -----------------------------
+class Session:
+    def __init__(self, email: str, student: bool, think: float, timings: Dict[str, List[float]], lock: threading.Lock):
+        self.email = email
+        self.student = student
+        self.think = think
+        self.timings = timings
+        self.lock = lock
+        self.errors: List[str] = []
+        self.at = AppTest.from_file(APP_PATH, default_timeout=60)
+
+    def _pause(self) -> None:
+        if self.think:
+            time.sleep(random.uniform(0.5, 1.5) * self.think)
+
+    def _run(self, step: str, widget=None) -> None:
+        queued = time.perf_counter()
+        with RUN_LOCK:
+            start = time.perf_counter()
+            (widget or self.at).run()
+            end = time.perf_counter()
+        with self.lock:
+            self.timings.setdefault(step, []).append(end - queued)
+            self.timings.setdefault("service", []).append(end - start)
+        if self.at.exception:
+            self.errors.append(f"{step}: {self.at.exception[0].message}")
+
+    def _button(self, label: str):
+        return next(b for b in self.at.button if b.label == label)
+
+    def _navigate(self, step: str, label: str) -> None:
+        # nav_to() only sets the page, so the new page renders on the following rerun
+        self._run(step, self._button(label).click())
+        self._run("page_render")
+
+    def walk(self) -> None:
+        at = self.at
+        self._run("initial_load")
+        self._pause()
+
+        at.text_input[0].input(self.email)
+        at.text_input[1].input(PASSWORD)
+        self._navigate("login", "Login")
+        self._pause()
+
+        at.text_input[0].input("New laptop")
+        at.number_input[0].set_value(20000.0)
+        # Students are asked for daily pocket money, professionals for a monthly salary
+        at.number_input[1].set_value(500.0 if self.student else 30000.0)
+        at.number_input[2].set_value(150.0)
+        # Submit already calls st.rerun(), which lands on the dashboard
+        self._run("predefined_questions", self._button("Submit").click())
+        self._pause()
+
+        self._navigate("open_chatbot", "💬 ProfitMate AI")
+        for msg in ("interest", "50000", "3", "no"):
+            self._pause()
+            at.text_input[0].input(msg)
+            self._run("chat_message", self._button("Send").click())
+        # Back also calls st.rerun()
+        self._run("back_to_dashboard", self._button("⬅ Back").click())
+        self._pause()
+
+        self._navigate("open_ecotally", "🌱 EcoTally")
+        at.number_input[0].set_value(400.0)
+        self._run("ecotally_input")
+        self._navigate("back_to_dashboard", "⬅ Back to Dashboard")
+        self._pause()
+
+        self._navigate("open_budget_summary", "📊 Budget Summary")
+        self._pause()
+        if at.select_slider:
+            self._run("whatif_slider", at.select_slider[0].set_value(25))
+
+# -----------------------------
+# Runner
+# -----------------------------
+def run(sessions: int, think: float, ramp: float) -> Dict[str, Any]:
+    timings: Dict[str, List[float]] = {}
+    lock = threading.Lock()
+    warmup_email, *emails = seed_accounts(sessions + 1)
+    # seed_accounts makes even-numbered accounts students
+    walkers = [Session(e, i % 2 == 0, think, timings, lock) for i, e in enumerate(emails, start=1)]
+
+    # One untimed walk first loads pandas, altair and the app modules and fills
+    # the process-wide caches, so the baselines below exclude one-time costs
+    warmup = Session(warmup_email, True, 0.0, {}, threading.Lock())
+    warmup.walk()
+
+    def start(i: int) -> None:
+        time.sleep(ramp * i / max(sessions, 1))
+        walkers[i].walk()
+
+    rss_before = bench.rss_mb()
+    cpu_before = time.process_time()
+    wall_before = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        list(pool.map(start, range(sessions)))
+    wall = time.perf_counter() - wall_before
+    cpu = time.process_time() - cpu_before
+    rss_after = bench.rss_mb()
+
+    errors = [e for w in (warmup, *walkers) for e in w.errors]
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": bench.git_commit(),
+        "python": sys.version.split()[0],
+        "sessions": sessions,
+        "think_s": think,
+        "ramp_s": ramp,
+        "wall_s": wall,
+        "cpu_s": cpu,
+        "cpu_s_per_session": cpu / sessions,
+        "cpu_utilization": cpu / wall if wall else 0.0,
+        "rss_before_mb": rss_before,
+        "rss_after_mb": rss_after,
+        "rss_mb_per_session": (rss_after - rss_before) / sessions,
+        "errors": errors,
+        "service": _percentiles(timings.pop("service", [])),
+        "overall": _percentiles([t for ts in timings.values() for t in ts]),
+        "steps": {step: _percentiles(ts) for step, ts in sorted(timings.items())},
+    }
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    rows = [("overall p50_ms", current["overall"].get("p50_ms"), baseline["overall"].get("p50_ms")),
+            ("overall p99_ms", current["overall"].get("p99_ms"), baseline["overall"].get("p99_ms")),
+            ("service p50_ms", current["service"].get("p50_ms"), baseline.get("service", {}).get("p50_ms")),
+            ("cpu_s_per_session", current["cpu_s_per_session"], baseline.get("cpu_s_per_session")),
+            ("rss_mb_per_session", current["rss_mb_per_session"], baseline.get("rss_mb_per_session"))]
+    for step in current["steps"]:
+        rows.append((f"{step} p50_ms", current["steps"][step].get("p50_ms"),
+                     baseline.get("steps", {}).get(step, {}).get("p50_ms")))
+    bench.compare(baseline, rows)
+
+def _print_report(result: Dict[str, Any]) -> None:
+    print(f"sessions={result['sessions']} wall={result['wall_s']:.1f}s "
+          f"cpu/session={result['cpu_s_per_session']:.3f}s cpu_util={result['cpu_utilization']:.0%} "
+          f"rss/session={result['rss_mb_per_session']:.2f}MB")
+    print(f"{'step':<24}{'count':>7}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}  (ms)")
+    for step, p in [*result["steps"].items(), ("overall", result["overall"]), ("service", result["service"])]:
+        print(f"{step:<24}{p['count']:>7}{p['p50_ms']:>10.1f}{p['p90_ms']:>10.1f}{p['p99_ms']:>10.1f}{p['max_ms']:>10.1f}")
+    if result["errors"]:
+        print(f"{len(result['errors'])} errors, first: {result['errors'][0]}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=10, help="concurrent simulated sessions")
+    parser.add_argument("--think", type=float, default=0.5, help="mean think time between actions (s)")
+    parser.add_argument("--ramp", type=float, default=2.0, help="spread session starts over this many seconds")
+    parser.add_argument("--compare", default=None, help="earlier result JSON to compare against")
+    parser.add_argument("--out", default=None, help="result path (default: loadtest_results/<timestamp>.json)")
+    args = parser.parse_args(argv)
+
+    baseline = bench.load_result(args.compare) if args.compare else None
+
+    with bench.scratch_dir("loadtest-"):
+        result = run(args.sessions, args.think, args.ramp)
+    out = bench.save_result(result, args.out, RESULTS_DIR)
+
+    _print_report(result)
+    if baseline:
+        compare(result, baseline)
+    print(f"\nSaved {out}")
+
+if __name__ == "__main__":
+    main()
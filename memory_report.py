@@ -0,0 +1,89 @@
+"""Per-session memory accounting for app.py.
+
+    python memory_report.py --sessions 200
+
+Opens N idle sessions (the login page, as a fresh visitor sees it) with
+streamlit's AppTest. It then measures what each session's st.session_state
+holds. Objects shared between sessions, such as process-wide cached
+resources and interned strings, are counted once, for the first session
+only. The "unique" figure is therefore what every further idle session
+costs. It is projected to --project sessions (default 10k).
+"""
+import argparse
+import os
+import sys
+from types import MappingProxyType
+from typing import Dict, Any, Set
+
+import bench
+from bench import HERE
+
+APP_PATH = os.path.join(HERE, "app.py")
+
+# -----------------------------
+# Accounting
+# -----------------------------
+def deep_sizeof(obj: Any, seen: Set[int]) -> int:
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (dict, MappingProxyType)):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(x, seen) for x in obj)
+    elif hasattr(obj, "__slots__"):
+        size += sum(deep_sizeof(getattr(obj, s), seen) for s in obj.__slots__ if hasattr(obj, s))
+    elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+        size += deep_sizeof(vars(obj), seen)
+    return size
+
+def session_footprint(state: Dict[str, Any], seen: Set[int] = None) -> Dict[str, int]:
+    """Bytes held by each session_state key, not counting objects already in `seen`."""
+    seen = set() if seen is None else seen
+    return {key: deep_sizeof(value, seen) for key, value in state.items()}
+
+# -----------------------------
+# Report
+# -----------------------------
+def measure(sessions: int) -> Dict[str, Any]:
+    from streamlit.testing.v1 import AppTest
+
+    apps = [AppTest.from_file(APP_PATH, default_timeout=60) for _ in range(sessions)]
+    for at in apps:
+        at.run()
+
+    shared: Set[int] = set()
+    first = session_footprint(dict(apps[0].session_state.items()), shared)
+    per_key: Dict[str, int] = {}
+    for at in apps[1:]:
+        for key, size in session_footprint(dict(at.session_state.items()), shared).items():
+            per_key[key] = per_key.get(key, 0) + size
+    rest = max(sessions - 1, 1)
+    return {
+        "first_session": first,
+        "unique_per_session": {k: v / rest for k, v in sorted(per_key.items())},
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=200, help="idle sessions to open")
+    parser.add_argument("--project", type=int, default=10_000, help="project the unique cost to this many sessions")
+    args = parser.parse_args(argv)
+
+    # Run in a scratch directory so the real account store and chat log are untouched
+    with bench.scratch_dir("memreport-"):
+        result = measure(max(args.sessions, 2))
+
+    first, unique = result["first_session"], result["unique_per_session"]
+    width = max(len(k) for k in ("session_state key", *first, *unique)) + 2
+    print(f"{'session_state key':<{width}}{'first (B)':>12}{'unique (B)':>12}")
+    for key in sorted(set(first) | set(unique)):
+        print(f"{key:<{width}}{first.get(key, 0):>12,}{unique.get(key, 0):>12,.0f}")
+    total = sum(unique.values())
+    print(f"{'total':<{width}}{sum(first.values()):>12,}{total:>12,.0f}")
+    print(f"\nUnique bytes per idle session: {total:,.0f}  ->  "
+          f"{total * args.project / (1024 * 1024):,.2f} MB at {args.project:,} sessions")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import math
+from typing import Dict, Any, Callable, Set, Tuple
+
+import budget
+from finance_config import get_config
+
+# -----------------------------
+# Derived metric nodes
+# -----------------------------
+INPUTS = ("role", "pocket", "salary", "spending", "target", "saved", "days_per_month")
+
+NODES: Dict[str, Tuple[Callable, Tuple[str, ...]]] = {}
+
+def node(*deps: str):
+    def register(fn):
+        NODES[fn.__name__] = (fn, deps)
+        return fn
+    return register
+
+@node("role", "pocket", "salary", "days_per_month")
+def daily_income(role, pocket, salary, days_per_month):
+    return budget.daily_income(role, pocket, salary, days_per_month)
+
+@node("daily_income", "spending")
+def daily_savings(income, spending):
+    return income - spending
+
+@node("daily_savings", "days_per_month")
+def monthly_savings(savings, days_per_month):
+    return savings * days_per_month
+
+@node("target", "saved")
+def remaining_amount(target, saved):
+    return target - saved
+
+@node("remaining_amount", "daily_savings")
+def days_needed(rest, savings):
+    return rest / savings if savings > 0 else math.inf
+
+@node("target", "saved")
+def progress(target, saved):
+    return min(saved / target, 1.0) if target else 0.0
+
+def _dependents() -> Dict[str, Set[str]]:
+    # Transitive closure: every node that must be invalidated when a name changes
+    direct: Dict[str, Set[str]] = {}
+    for name, (_, deps) in NODES.items():
+        for dep in deps:
+            direct.setdefault(dep, set()).add(name)
+    closure = {}
+    for name in (*INPUTS, *NODES):
+        seen, stack = set(), list(direct.get(name, ()))
+        while stack:
+            n = stack.pop()
+            if n not in seen:
+                seen.add(n)
+                stack.extend(direct.get(n, ()))
+        closure[name] = seen
+    return closure
+
+DEPENDENTS = _dependents()
+
+# -----------------------------
+# Graph
+# -----------------------------
+class MetricsGraph:
+    """Memoized derived financial metrics.
+
+    Inputs are set with update(); a node is recomputed only when one of its
+    upstream inputs actually changed since it was last read.
+    """
+
+    def __init__(self, **inputs: Any):
+        self._inputs: Dict[str, Any] = {"role": "", "pocket": 0.0, "salary": 0.0,
+                                        "spending": 0.0, "target": 0.0, "saved": 0.0,
+                                        "days_per_month": get_config().days_per_month}
+        self._values: Dict[str, Any] = {}
+        self.update(**inputs)
+
+    def update(self, **inputs: Any) -> None:
+        for name, value in inputs.items():
+            if name not in self._inputs:
+                raise KeyError(f"Unknown metric input: {name}")
+            if self._inputs[name] != value:
+                self._inputs[name] = value
+                for dependent in DEPENDENTS[name]:
+                    self._values.pop(dependent, None)
+
+    def update_from(self, data: Dict[str, Any]) -> None:
+        self.update(**{k: data[k] for k in INPUTS if k in data})
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._inputs:
+            return self._inputs[name]
+        if name not in self._values:
+            fn, deps = NODES[name]
+            self._values[name] = fn(*(self[d] for d in deps))
+        return self._values[name]
@@ -0,0 +1,99 @@
+"""Warm up process-wide caches, then serve app.py.
+
+    python serve.py                        # same as `streamlit run app.py`
+    python serve.py --server.port 8080     # extra arguments go to `streamlit run`
+
+A fresh process otherwise builds all of this on its first request: the
+heavy imports, the chart schema, the stylesheet with its embedded background
+image, the finance config and tax table, the account store schema and the
+chat snapshot replay. Here they are built before the server starts listening,
+in the same process, so the first session renders like any later one.
+coldstart.py measures the result.
+"""
+import importlib
+import inspect
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+# Everything app.py imports that is not already loaded by streamlit itself
+MODULES = ("numpy", "pandas", "altair", "streamlit",
+           "accounts", "accrual", "assets", "budget", "chat_snapshot", "finance_config", "goals", "metrics")
+# Streamlit internals loaded lazily by the first script run (page_icon validation)
+STREAMLIT_LAZY_MODULES = ("streamlit.emojis",)
+
+# -----------------------------
+# Warm-up steps
+# -----------------------------
+def _imports() -> None:
+    for name in MODULES:
+        importlib.import_module(name)
+    for name in STREAMLIT_LAZY_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+def _frame_inspection() -> None:
+    # Streamlit walks the call stack on the first element a process renders.
+    # inspect then resolves the file of every loaded module, which is slow
+    # once pandas and altair are in; doing it last fills inspect's cache.
+    inspect.stack()
+
+def _chart_schema() -> None:
+    # Altair loads and compiles the Vega-Lite schema on the first chart it validates
+    import altair as alt
+    import pandas as pd
+    alt.Chart(pd.DataFrame({"x": [0], "y": [0]})).mark_line().encode(x="x", y="y").to_dict()
+
+def _stylesheet() -> None:
+    import assets
+    assets.background_css()
+
+def _finance_tables() -> None:
+    from finance_config import get_config, monthly_tax
+    get_config()
+    monthly_tax(0.0)
+
+def _account_store() -> None:
+    # Creates the schema so the app's first connect has nothing to do
+    import accounts
+    accounts.connect().close()
+
+def _chat_log() -> None:
+    import chat_snapshot
+    chat_snapshot.shared_log()
+
+STEPS: List[Tuple[str, Callable[[], None]]] = [
+    ("imports", _imports),
+    ("chart schema", _chart_schema),
+    ("stylesheet", _stylesheet),
+    ("finance tables", _finance_tables),
+    ("account store", _account_store),
+    ("chat log", _chat_log),
+    ("frame inspection", _frame_inspection),
+]
+
+def warm_up() -> Dict[str, float]:
+    """Run every warm-up step; returns seconds per step."""
+    timings = {}
+    for name, step in STEPS:
+        start = time.perf_counter()
+        step()
+        timings[name] = time.perf_counter() - start
+    return timings
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    timings = warm_up()
+    print("Warm-up: " + ", ".join(f"{name} {secs * 1000:.0f}ms" for name, secs in timings.items())
+          + f" (total {sum(timings.values()):.2f}s)", flush=True)
+
+    from streamlit.web import cli
+    cli.main(["run", APP_PATH, *args], prog_name="streamlit")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+import pytest
+
+import accounts
+
+PROFILE = {"email": "New@Example.com", "first": "Ann", "last": "Lee", "role": "Student", "core": "CSE",
+           "password_hash": accounts.hash_password("Secret-pw1!")}
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = accounts.connect(str(tmp_path / "accounts.db"))
+    yield conn
+    conn.close()
+
+def test_create_user(conn):
+    assert accounts.create_user(conn, PROFILE)
+    user = accounts.get_user(conn, "new@example.com")
+    assert user["email"] == "New@Example.com" and user["core"] == "CSE" and user["first_login"]
+    assert accounts.verify_password("Secret-pw1!", user["password_hash"])
+
+def test_create_user_rejects_taken_email(conn):
+    assert accounts.create_user(conn, PROFILE)
+    assert not accounts.create_user(conn, dict(PROFILE, email="new@example.com", first="Other"))
+    assert accounts.get_user(conn, "new@example.com")["first"] == "Ann"
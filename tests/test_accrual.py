@@ -0,0 +1,45 @@
+from datetime import date, timedelta
+
+import pytest
+
+import accounts
+import accrual
+
+TODAY = date.today()
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = accounts.connect(str(tmp_path / "accounts.db"))
+    accounts.save_budget(conn, "student@example.com", {"role": "Student", "pocket": 100.0, "spending": 40.0,
+                                                       "purpose": "bike", "target": 1000.0, "saved": 5.0})
+    accounts.save_budget(conn, "pro@example.com", {"role": "Professional", "salary": 30000.0, "spending": 150.0,
+                                                   "purpose": "car", "target": 50000.0, "saved": 0.0})
+    accounts.save_budget(conn, "over@example.com", {"role": "Student", "pocket": 50.0, "spending": 80.0,
+                                                    "purpose": "phone", "target": 500.0, "saved": 20.0})
+    yield conn
+    conn.close()
+
+def saved(conn):
+    return {k: accounts.get_saved(conn, k) for k in ("student@example.com", "pro@example.com", "over@example.com")}
+
+def test_same_day_is_a_noop(conn):
+    assert accrual.accrue(conn, TODAY) == 0
+    assert saved(conn) == {"student@example.com": 5.0, "pro@example.com": 0.0, "over@example.com": 20.0}
+
+def test_accrues_daily_savings_and_is_idempotent(conn):
+    assert accrual.accrue(conn, TODAY + timedelta(days=1)) == 3
+    assert accrual.accrue(conn, TODAY + timedelta(days=1)) == 0
+    assert saved(conn) == {"student@example.com": 65.0, "pro@example.com": 850.0, "over@example.com": 20.0}
+
+def test_catches_up_missed_days(conn):
+    accrual.accrue(conn, TODAY + timedelta(days=1))
+    accrual.accrue(conn, TODAY + timedelta(days=4))
+    assert saved(conn)["student@example.com"] == 5.0 + 4 * 60.0
+    assert saved(conn)["pro@example.com"] == 4 * 850.0
+
+def test_saving_a_budget_restarts_accrual(conn):
+    accrual.accrue(conn, TODAY + timedelta(days=2))
+    data = accounts.get_budget(conn, "student@example.com")
+    assert data["saved"] == 125.0
+    accounts.save_budget(conn, "student@example.com", dict(data, saved=10.0))
+    assert accounts.get_saved(conn, "student@example.com") == 10.0
@@ -0,0 +1,65 @@
+import csv
+
+import pytest
+
+import accounts
+import bulk_accounts
+from bulk_accounts import validate_row
+
+STUDENT = {"first": "Ann", "last": "Lee", "email": "ann@example.com", "password": "Secret-pw1!",
+           "confirm": "Secret-pw1!", "role": "student", "core": "CSE", "industry": ""}
+PROFESSIONAL = dict(STUDENT, email="bob@example.com", first="Bob", role="Professional", core="", industry="IT")
+
+# -----------------------------
+# Validation
+# -----------------------------
+def test_valid_rows():
+    profile, err = validate_row(STUDENT)
+    assert err == "" and profile["role"] == "Student" and profile["core"] == "CSE" and profile["industry"] is None
+    profile, err = validate_row(dict(PROFESSIONAL, core="ignored"))
+    assert err == "" and profile["core"] is None and profile["industry"] == "IT"
+    # confirm is optional
+    assert validate_row(dict(STUDENT, confirm=""))[1] == ""
+
+@pytest.mark.parametrize("row, error", [
+    (dict(STUDENT, first=" "), "Missing first or last name."),
+    (dict(STUDENT, email="ann@example"), "Invalid email address."),
+    (dict(STUDENT, email="ann example.com"), "Invalid email address."),
+    (dict(STUDENT, role="Teacher"), "Role must be Student or Professional."),
+    (dict(STUDENT, core=""), "Missing Core."),
+    (dict(PROFESSIONAL, industry=""), "Missing Industry Name."),
+    (dict(STUDENT, password="short", confirm="short"), "Password must be at least 8 characters."),
+    (dict(STUDENT, confirm="Secret-pw2!"), "Passwords do not match."),
+    (dict(STUDENT, password="", confirm="", password_hash="not-a-hash"), "Password must be at least 8 characters."),
+])
+def test_rejected_rows_match_signup(row, error):
+    assert validate_row(row) == (None, error)
+
+# -----------------------------
+# Import / export
+# -----------------------------
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+def test_export_reimports_password_hashes(tmp_path):
+    src, dst = str(tmp_path / "src.db"), str(tmp_path / "dst.db")
+    write_csv(tmp_path / "in.csv", [STUDENT, PROFESSIONAL, dict(STUDENT, first="Dup"), dict(STUDENT, email="bad")])
+    stats = bulk_accounts.import_accounts(str(tmp_path / "in.csv"), src, workers=1,
+                                          rejects_path=str(tmp_path / "rejects.csv"))
+    assert (stats["rows"], stats["inserted"], stats["duplicates"], stats["rejected"]) == (4, 2, 1, 1)
+    with open(tmp_path / "rejects.csv", newline="") as f:
+        assert list(csv.reader(f))[1] == ["5", "bad", "Invalid email address."]
+
+    assert bulk_accounts.export_accounts(str(tmp_path / "out.csv"), src)["rows"] == 2
+    stats = bulk_accounts.import_accounts(str(tmp_path / "out.csv"), dst, workers=1)
+    assert (stats["inserted"], stats["rejected"]) == (2, 0)
+
+    conn = accounts.connect(dst)
+    for row in (STUDENT, PROFESSIONAL):
+        user = accounts.get_user(conn, row["email"])
+        assert accounts.verify_password(row["password"], user["password_hash"])
+        assert user["first"] == row["first"] and user["first_login"]
+    conn.close()
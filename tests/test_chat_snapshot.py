@@ -0,0 +1,130 @@
+import os
+
+import pytest
+
+import chat_snapshot
+from chat_snapshot import ChatState, SnapshotLog, new_state, pack_state, unpack_state
+
+GREETING = ("bot", "✨ Hi there! What would you like to do today?\nOptions: Business, Interest, Profit-Loss")
+
+def business_state() -> ChatState:
+    return ChatState(step=2, mode="business", idea="café")
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "chat_snapshots.bin")
+
+def reopen(log: SnapshotLog) -> SnapshotLog:
+    log.close()
+    return SnapshotLog(log.path)
+
+# -----------------------------
+# State encoding
+# -----------------------------
+@pytest.mark.parametrize("state", [
+    new_state(),
+    business_state(),
+    ChatState(step=12, mode="interest", deposit=150000.0, years=2.5, senior=True),
+    ChatState(step=99, mode="interest", deposit=1.0, years=1.0, senior=False),
+    ChatState(step=21, mode="profit", salary=50000.0, spending=12345.67),
+])
+def test_state_round_trip(state):
+    assert unpack_state(pack_state(state)) == state
+
+# -----------------------------
+# Log replay
+# -----------------------------
+def test_log_round_trip(path):
+    log = SnapshotLog(path)
+    log.append_delta("a@example.com", [GREETING], ChatState(step=1))
+    log.append_delta("b@example.com", [GREETING], ChatState(step=1))
+    log.append_delta("a@example.com", [("user", "business"), ("bot", "Great! Enter your business idea.")],
+                     ChatState(step=2, mode="business"))
+    log.append_delta("a@example.com", [("user", "café")], business_state())
+    expected = {key: log.restore(key) for key in ("a@example.com", "b@example.com")}
+
+    log = reopen(log)
+    for key, (history, state) in expected.items():
+        assert log.restore(key) == (history, state)
+    assert log.restore("a@example.com")[0][-1] == ("user", "café")
+    log.close()
+
+def test_restore_unknown_key_is_fresh(path):
+    log = SnapshotLog(path)
+    assert log.restore("nobody@example.com") == ([], new_state())
+    log.close()
+
+def test_restore_returns_copies(path):
+    log = SnapshotLog(path)
+    log.append_delta("a@example.com", [GREETING], ChatState(step=1))
+    history, state = log.restore("a@example.com")
+    history.append(("user", "business"))
+    state["step"] = 5
+    assert log.restore("a@example.com") == ([GREETING], ChatState(step=1))
+    log.close()
+
+def test_torn_tail_is_dropped(path):
+    log = SnapshotLog(path)
+    log.append_delta("a@example.com", [GREETING], ChatState(step=1))
+    log.close()
+    good_size = os.path.getsize(path)
+
+    # A crash mid-write leaves a partial record at the end of the file
+    partial = chat_snapshot._record(chat_snapshot.REC_TURN, b"a@example.com",
+                                    chat_snapshot._turn_payload(("user", "business")))
+    with open(path, "ab") as f:
+        f.write(partial[:-3])
+
+    log = SnapshotLog(path)
+    assert log.restore("a@example.com") == ([GREETING], ChatState(step=1))
+    assert os.path.getsize(path) == good_size
+
+    # Records written after the repair replay normally
+    log.append_delta("a@example.com", [("user", "business")], ChatState(step=2, mode="business"))
+    log = reopen(log)
+    assert log.restore("a@example.com") == ([GREETING, ("user", "business")], ChatState(step=2, mode="business"))
+    log.close()
+
+def test_reset_clears_history_and_state(path):
+    log = SnapshotLog(path)
+    log.append_delta("a@example.com", [GREETING, ("user", "café")], business_state())
+    log.append_delta("b@example.com", [GREETING], ChatState(step=1))
+    log.reset("a@example.com")
+    assert log.restore("a@example.com") == ([], new_state())
+
+    # The process may die before the greeting is appended; replay must not revive the old state
+    log = reopen(log)
+    assert log.restore("a@example.com") == ([], new_state())
+    assert log.restore("b@example.com") == ([GREETING], ChatState(step=1))
+    log.close()
+
+def test_turns_after_reset_replay_from_fresh_state(path):
+    log = SnapshotLog(path)
+    log.append_delta("a@example.com", [GREETING, ("user", "café")], business_state())
+    log.reset("a@example.com")
+    log.append_delta("a@example.com", [GREETING], ChatState(step=1))
+    log = reopen(log)
+    assert log.restore("a@example.com") == ([GREETING], ChatState(step=1))
+    log.close()
+
+def test_compact_keeps_live_sessions(path):
+    log = SnapshotLog(path)
+    for i in range(20):
+        log.append_delta("a@example.com", [("user", f"msg {i}")], ChatState(step=i))
+    log.reset("a@example.com")
+    log.append_delta("a@example.com", [GREETING], ChatState(step=1))
+    log.append_delta("b@example.com", [GREETING], ChatState(step=1))
+    size = os.path.getsize(path)
+
+    log.compact()
+    assert os.path.getsize(path) < size
+    log = reopen(log)
+    assert log.restore("a@example.com") == ([GREETING], ChatState(step=1))
+    assert log.restore("b@example.com") == ([GREETING], ChatState(step=1))
+    log.close()
+
+def test_rejects_foreign_file(path):
+    with open(path, "wb") as f:
+        f.write(b"NOPE\x01")
+    with pytest.raises(ValueError):
+        SnapshotLog(path)
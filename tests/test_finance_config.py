@@ -0,0 +1,105 @@
+import json
+import os
+
+import pytest
+
+import finance_config
+from finance_config import DEFAULTS, get_config, growth_factor, monthly_tax, versioned_cache
+
+def old_monthly_tax(income):
+    # The hard-coded slabs monthly_tax used before they moved to finance_config.json
+    annual = income * 12
+    tax = 0
+    if annual <= 250000:
+        tax = 0
+    elif annual <= 500000:
+        tax = (annual - 250000) * 0.05
+    elif annual <= 1000000:
+        tax = 250000*0.05 + (annual - 500000)*0.2
+    else:
+        tax = 250000*0.05 + 500000*0.2 + (annual - 1000000)*0.3
+    return round(tax/12,2)
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    path = tmp_path / "finance_config.json"
+    monkeypatch.setattr(finance_config, "CONFIG_PATH", str(path))
+    monkeypatch.setattr(finance_config, "CHECK_INTERVAL", 0.0)
+    monkeypatch.setattr(finance_config, "_config", None)
+    monkeypatch.setattr(finance_config, "_mtime", None)
+    stamp = [1_000_000_000]
+
+    def write(raw):
+        path.write_text(raw if isinstance(raw, str) else json.dumps(raw))
+        # A distinct mtime per write, however fast the writes come
+        stamp[0] += 1
+        os.utime(path, ns=(stamp[0], stamp[0]))
+    write(DEFAULTS)
+    return write
+
+def with_rates(regular, senior):
+    return dict(DEFAULTS, deposit_rates={"regular": regular, "senior": senior})
+
+# -----------------------------
+# Tax table
+# -----------------------------
+def test_monthly_tax_matches_old_slabs(config_file):
+    incomes = [-100.0, 0.0, 0.01, 19_999.99, 500_000.0, 1_234_567.89]
+    for slab_edge in (250000, 500000, 1000000):
+        incomes += [slab_edge / 12 + d for d in (-0.01, 0.0, 0.01)]
+    incomes += [i * 7.3 for i in range(0, 200_000, 37)]
+    for income in incomes:
+        assert monthly_tax(income) == old_monthly_tax(income), income
+
+def test_rejects_slabs_out_of_order():
+    with pytest.raises(ValueError):
+        finance_config.FinanceConfig(dict(DEFAULTS, tax_slabs=[{"up_to": 500000, "rate": 0.1},
+                                                                {"up_to": 250000, "rate": 0.2},
+                                                                {"up_to": None, "rate": 0.3}]), "x")
+    with pytest.raises(ValueError):
+        finance_config.FinanceConfig(dict(DEFAULTS, tax_slabs=[{"up_to": 250000, "rate": 0.1}]), "x")
+
+# -----------------------------
+# Reloading
+# -----------------------------
+def test_reload_bumps_version(config_file):
+    first = get_config()
+    assert get_config() is first
+    config_file(with_rates(0.07, 0.09))
+    second = get_config()
+    assert second.version != first.version and second.regular_rate == 0.07
+
+def test_invalid_file_keeps_last_good_config(config_file, capsys):
+    good = get_config()
+    config_file("{ not json")
+    assert get_config() is good
+    config_file(dict(DEFAULTS, days_per_month=0))
+    assert get_config() is good
+    assert "keeping version " + good.version in capsys.readouterr().err
+
+    config_file(with_rates(0.07, 0.09))
+    assert get_config().regular_rate == 0.07
+
+def test_versioned_cache_clears_on_new_version(config_file):
+    calls = []
+
+    @versioned_cache()
+    def rate(senior):
+        calls.append(senior)
+        return get_config().deposit_rate(senior)
+
+    assert rate(False) == 0.06 and rate(False) == 0.06
+    assert calls == [False]
+    config_file(with_rates(0.07, 0.09))
+    assert rate(False) == 0.07
+    assert calls == [False, False]
+
+    # Rewriting the same contents keeps the version, so the cache survives
+    config_file(with_rates(0.07, 0.09))
+    assert rate(False) == 0.07 and calls == [False, False]
+
+def test_growth_factor_follows_rates(config_file):
+    growth_factor.cache_clear()
+    assert growth_factor(True, 2.0) == pytest.approx(1.08 ** 2)
+    config_file(with_rates(0.06, 0.1))
+    assert growth_factor(True, 2.0) == pytest.approx(1.1 ** 2)
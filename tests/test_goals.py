@@ -0,0 +1,90 @@
+from datetime import date, timedelta
+
+import pytest
+
+from goals import GoalPlanner
+
+TODAY = date(2026, 1, 1)
+
+def goal(purpose, target, priority=1, days=None, saved=0.0):
+    deadline = (TODAY + timedelta(days=days)).isoformat() if days is not None else None
+    return {"purpose": purpose, "target": target, "saved": saved, "deadline": deadline, "priority": priority}
+
+GOALS = [goal("a", 100.0, days=10), goal("b", 200.0, days=10), goal("c", 100.0, priority=2, days=10)]
+
+def allocations(planner, budget):
+    return {r["purpose"]: r["allocated"] for r in planner.plan(budget)}
+
+def assert_same_plan(planner, goals, budget):
+    fresh = GoalPlanner(goals, TODAY)
+    assert [r["purpose"] for r in planner.plan(budget)] == [r["purpose"] for r in fresh.plan(budget)]
+    assert allocations(planner, budget) == pytest.approx(allocations(fresh, budget))
+    assert planner._tier_required == pytest.approx(fresh._tier_required)
+
+# -----------------------------
+# Allocation
+# -----------------------------
+def test_underfunded_tier_is_water_filled():
+    rows = {r["purpose"]: r for r in GoalPlanner(GOALS, TODAY).plan(15.0)}
+    # Tier 1 needs 30/day; every goal in it gets half its required rate
+    assert rows["a"]["allocated"] == pytest.approx(5.0)
+    assert rows["b"]["allocated"] == pytest.approx(10.0)
+    assert rows["c"]["allocated"] == 0.0
+    assert rows["c"]["days"] == float("inf")
+    assert not any(r["on_track"] for r in rows.values())
+
+def test_surplus_is_split_by_priority_weight():
+    # Deadlines take 30 + 10, and the remaining 10 is split 1 : 1 : 1/2
+    assert allocations(GoalPlanner(GOALS, TODAY), 50.0) == pytest.approx({"a": 14.0, "b": 24.0, "c": 12.0})
+
+def test_unfunded_goal_without_deadline_is_not_on_track():
+    planner = GoalPlanner([*GOALS, goal("d", 100.0, priority=2)], TODAY)
+    row = next(r for r in planner.plan(15.0) if r["purpose"] == "d")
+    assert row["allocated"] == 0.0 and not row["on_track"]
+    row = next(r for r in planner.plan(50.0) if r["purpose"] == "d")
+    assert row["allocated"] > 0 and row["on_track"]
+
+def test_finished_goal_is_on_track():
+    row = GoalPlanner([goal("done", 100.0, saved=100.0)], TODAY).plan(0.0)[0]
+    assert row["days"] == 0.0 and row["on_track"]
+
+def test_overdue_goal_is_due_tomorrow():
+    overdue = goal("late", 100.0, days=-5, saved=40.0)
+    planner = GoalPlanner([overdue], TODAY)
+    row = planner.plan(30.0)[0]
+    assert row["required"] == pytest.approx(60.0)
+    assert row["days"] == pytest.approx(2.0) and not row["on_track"]
+    assert planner.plan(100.0)[0]["on_track"]
+
+# -----------------------------
+# Incremental updates
+# -----------------------------
+def test_reprioritising_moves_goal_to_new_tier():
+    planner = GoalPlanner(GOALS, TODAY)
+    planner.plan(50.0)
+    moved = dict(GOALS[0], priority=3)
+    planner.upsert(moved)
+    goals = [moved, *GOALS[1:]]
+    assert [r["purpose"] for r in planner.plan(50.0)] == ["b", "c", "a"]
+    assert_same_plan(planner, goals, 50.0)
+
+    # Emptying a tier drops its total rather than leaving a stale zero behind
+    planner.upsert(dict(GOALS[1], priority=2))
+    assert set(planner._tier_required) == {2, 3}
+    assert_same_plan(planner, [moved, dict(GOALS[1], priority=2), GOALS[2]], 15.0)
+
+def test_upsert_and_remove_match_a_fresh_planner():
+    planner = GoalPlanner(GOALS, TODAY)
+    before = allocations(planner, 50.0)
+    planner.upsert(dict(GOALS[1], saved=150.0))
+    assert allocations(planner, 50.0) != before
+    assert_same_plan(planner, [GOALS[0], dict(GOALS[1], saved=150.0), GOALS[2]], 50.0)
+
+    planner.remove("c")
+    planner.remove("missing")
+    assert len(planner) == 2 and planner.get("c") is None
+    assert_same_plan(planner, [GOALS[0], dict(GOALS[1], saved=150.0)], 50.0)
+
+    planner.remove("a")
+    planner.remove("b")
+    assert planner.plan(50.0) == [] and planner._tier_required == {} and planner._weight == 0.0